@@ -833,6 +833,7 @@ const blogPosts = [
             <h3>A New Era of Safety Through Innovation</h3><p>At VitaInspire, we believe in the transformative power of technology for social good. In India, this vision is vividly coming to life as Artificial Intelligence emerges as a powerful ally in enhancing women's safety. The landscape is shifting, with innovative solutions paving the way for a more secure and empowering environment for women across the nation.</p><h3>AI on the Frontlines: Practical Applications</h3><p>From smart wearables designed as fashion accessories to sophisticated AI systems capable of identifying potential threats before they escalate, India is at the forefront of embracing innovation. As highlighted by LinkedIn, these advanced AI systems are designed to offer real-time protection, making safety both accessible and intelligent. Beyond personal devices, we're seeing larger-scale initiatives. The Goa Industrial Development Corporation (GIDC), for instance, is proactively introducing AI-driven technologies to ensure a safer working environment for women in its estates, as reported by the Times of India. These examples underscore a growing commitment to leveraging AI for tangible impact on the ground.</p><h3>Navigating Challenges with Progressive Policy</h3><p>While the promise of AI is immense, we also acknowledge the evolving challenges it presents, such as the rise of deepfakes and digital violence, a concern underscored by UNFPA India. However, India is taking decisive steps to address these threats head-on. The nation’s commitment to leading globally in AI is evident through policy developments like the Digital Personal Data Protection Rules (2025) and the AI Governance Guidelines specifically targeting deepfake detection, both signaling important progress towards ensuring technology advances inclusion, not harm. While reports, such as one from LIJDLR, point to existing legal mechanisms still being fragmented, judicial responses like the Bombay High Court's 2025 deepfake-takedown order demonstrate a clear intent to adapt and respond effectively.</p><h3>A Future of Hope and Progress</h3><p>The data emerging through 2025 tells a compelling story of women in India pushing forward despite uneven ground, with the landscape shifting in real time, marked by transformation (YourStory HerStory). AI is not just a tool; it's a catalyst for this transformation, enabling women to navigate their lives with greater confidence and security. As we move forward, VitaInspire remains optimistic about the continued progress in integrating AI responsibly and effectively, ensuring it serves as a beacon of hope and a cornerstone of safety for every woman in India. Together, we can build a future where safety is a given, empowered by the ingenuity of AI.</p>
         `
     },
+
     {
         id: "ai-agriculture-india-2025-12-08",
         title: "Revolutionizing Roots: How AI is Cultivating Hope in Indian Agriculture",
@@ -857,7 +858,7 @@ const blogPosts = [
                 <h4>1. CottonAce in Maharashtra</h4>
                 <p>Cotton farmers in Maharashtra are using the <strong>CottonAce</strong> app, which employs AI to detect pink bollworm infestations early. Farmers essentially "scan" their traps, and the AI counts the pests and advises on pesticide application. This has led to a significant reduction in unnecessary chemical usage and saved crops from destruction.</p>
             </div>
-            
+
             <div class="blog-case-study">
                 <h4>2. 'Saagu Baagu' in Telangana</h4>
                 <p>The Telangana government's 'Saagu Baagu' (Agricultural Advancement) project is a prime example of scale. Using an AI-powered chatbot, the project provides chili farmers with advice on soil health and crop quality. The result? A reported doubling of income for many participating farmers due to better yield management.</p>
@@ -5,6 +5,12 @@ window.handleBlogImageError = function (img, category) {
     if (img.getAttribute('data-failed')) return;
     img.setAttribute('data-failed', 'true');
 
+    // Inside <picture>, <source> and srcset take precedence over src
+    if (img.parentElement && img.parentElement.tagName === 'PICTURE') {
+        img.parentElement.querySelectorAll('source').forEach(source => source.remove());
+    }
+    img.removeAttribute('srcset');
+
     // Map Categories to Base Images
     const cat = (category || '').toLowerCase();
     let fallback = 'technology_community.png'; // Default
@@ -366,7 +372,7 @@ document.addEventListener('DOMContentLoaded', function () {
 
     // Load blog assets manifest for infographics and audio
     let blogAssets = {};
-    fetch(`assets/blog/manifest.json?v=${new Date().getTime()}`)
+    const blogAssetsReady = fetch(`assets/blog/manifest.json?v=${new Date().getTime()}`)
         .then(response => response.json())
         .then(data => {
             blogAssets = data;
@@ -374,171 +380,194 @@ document.addEventListener('DOMContentLoaded', function () {
         })
         .catch(err => console.log('Blog assets manifest not found'));
 
-    // Render Blog Posts - Only latest 4 posts (each from different category)
-    if (blogGrid && typeof blogPosts !== 'undefined') {
-        const latestPosts = displayPosts;
-
-        latestPosts.forEach(post => {
-            const card = document.createElement('div');
-            card.className = 'blog-card blog-card-visual';
-
-            // Check if infographic and audio exist for this post
-            const hasInfographic = blogAssets[post.id]?.infographic;
-            const hasAudio = blogAssets[post.id]?.audio;
-            const infographicPath = hasInfographic || `assets/blog/infographics/${post.id}.png`;
-            const audioPath = hasAudio || `assets/blog/audio/${post.id}.mp3`;
-
-            card.innerHTML = `
-                <div class="blog-card-header-image">
-                    <img src="${infographicPath}?v=${new Date().getTime() + '7'}" alt="${post.title}" 
-                         onerror="handleBlogImageError(this, '${post.category}')">
-                    <span class="blog-category-tag">${post.category}</span>
-                </div>
-                <div class="blog-card-body">
-                    <div class="blog-meta-date">${post.date}</div>
-                    <h3 class="blog-title">${post.title}</h3>
-                    <div class="blog-card-footer">
-                        <button class="blog-audio-btn-text" data-audio="${audioPath}">
-                            🎧 Listen
-                        </button>
-                        <button class="blog-read-more">
-                            Read More →
-                        </button>
-                    </div>
-                </div>
-            `;
-
-            // Audio button click - play/pause audio
-            const audioBtn = card.querySelector('.blog-audio-btn-text');
-            let audio = new Audio(audioPath);
-            let isPlaying = false;
-
-            audio.onended = () => {
-                audioBtn.innerHTML = '🎧 Listen';
-                audioBtn.classList.remove('playing');
-                isPlaying = false;
-                audio.currentTime = 0;
-            };
-
-            function useTTS() {
-                // Determine if we are pausing or playing TTS
-                if (window.speechSynthesis.speaking && isPlaying) {
-                    window.speechSynthesis.cancel();
-                    audioBtn.innerHTML = '🎧 Listen';
-                    audioBtn.classList.remove('playing');
-                    isPlaying = false;
-                    return;
-                }
-
-                // Stop any other media/TTS
-                if (window.speechSynthesis.speaking) window.speechSynthesis.cancel();
+    // Responsive cover: WebP with PNG fallback, sized for the card width
+    function buildCoverPicture(src, variants, alt, category) {
+        const onError = `handleBlogImageError(this, '${category}')`;
+        if (!variants) {
+            return `<img src="${src}?v=${new Date().getTime() + '7'}" alt="${alt}" onerror="${onError}">`;
+        }
+        // Shared covers are content-addressed, so they can be cached without a version param
+        const srcset = list => list.map(v => `${v.src} ${v.width}w`).join(', ');
+        const sizes = '(max-width: 768px) 100vw, 400px';
+        const png = variants.png || [];
+        const fallback = png.length ? png[0].src : src;
+        return `
+            <picture>
+                ${variants.webp ? `<source type="image/webp" srcset="${srcset(variants.webp)}" sizes="${sizes}">` : ''}
+                <img src="${fallback}" srcset="${srcset(png)}" sizes="${sizes}" alt="${alt}"
+                     loading="lazy" decoding="async" onerror="${onError}">
+            </picture>`;
+    }
 
-                const tempDiv = document.createElement('div');
-                tempDiv.innerHTML = post.content;
-                const text = `${post.title}. ${tempDiv.innerText}`;
-                const utterance = new SpeechSynthesisUtterance(text);
+    // Render Blog Posts once the manifest is in, so cards use the shared cover paths
+    blogAssetsReady.then(() => {
+        if (blogGrid && typeof blogPosts !== 'undefined') {
+            const latestPosts = displayPosts;
+
+            latestPosts.forEach(post => {
+                const card = document.createElement('div');
+                card.className = 'blog-card blog-card-visual';
+
+                // Check if infographic and audio exist for this post
+                const hasInfographic = blogAssets[post.id]?.infographic;
+                const hasAudio = blogAssets[post.id]?.audio;
+                const infographicPath = hasInfographic || `assets/blog/infographics/${post.id}.png`;
+                const audioPath = hasAudio || `assets/blog/audio/${post.id}.mp3`;
+                const coverImage = buildCoverPicture(
+                    infographicPath, blogAssets[post.id]?.infographic_variants, post.title, post.category
+                );
+
+                card.innerHTML = `
+                    <div class="blog-card-header-image">
+                        ${coverImage}
+                        <span class="blog-category-tag">${post.category}</span>
+                    </div>
+                    <div class="blog-card-body">
+                        <div class="blog-meta-date">${post.date}</div>
+                        <h3 class="blog-title">${post.title}</h3>
+                        <div class="blog-card-footer">
+                            <button class="blog-audio-btn-text" data-audio="${audioPath}">
+                                🎧 Listen
+                            </button>
+                            <button class="blog-read-more">
+                                Read More →
+                            </button>
+                        </div>
+                    </div>
+                `;
 
-                utterance.onstart = () => {
-                    audioBtn.innerHTML = '⏸️ Pause';
-                    audioBtn.classList.add('playing');
-                    isPlaying = true;
-                };
+                // Audio button click - play/pause audio
+                const audioBtn = card.querySelector('.blog-audio-btn-text');
+                let audio = new Audio(audioPath);
+                let isPlaying = false;
 
-                utterance.onend = () => {
+                audio.onended = () => {
                     audioBtn.innerHTML = '🎧 Listen';
                     audioBtn.classList.remove('playing');
                     isPlaying = false;
+                    audio.currentTime = 0;
                 };
 
-                window.speechSynthesis.speak(utterance);
-            }
+                function useTTS() {
+                    // Determine if we are pausing or playing TTS
+                    if (window.speechSynthesis.speaking && isPlaying) {
+                        window.speechSynthesis.cancel();
+                        audioBtn.innerHTML = '🎧 Listen';
+                        audioBtn.classList.remove('playing');
+                        isPlaying = false;
+                        return;
+                    }
 
-            audio.onerror = () => {
-                console.log('Audio file missing event');
-                // We don't auto-play here on load, just note it. 
-                // The click handler will fail play() and trigger fallback.
-            };
+                    // Stop any other media/TTS
+                    if (window.speechSynthesis.speaking) window.speechSynthesis.cancel();
 
-            audioBtn.addEventListener('click', function (e) {
-                e.stopPropagation();
-                e.preventDefault();
+                    const tempDiv = document.createElement('div');
+                    tempDiv.innerHTML = post.content;
+                    const text = `${post.title}. ${tempDiv.innerText}`;
+                    const utterance = new SpeechSynthesisUtterance(text);
 
-                // Stop any other visual/audio state
-                if (window.currentBlogAudio && window.currentBlogAudio !== audio) {
-                    window.currentBlogAudio.pause();
-                    window.currentBlogAudio.currentTime = 0;
-                }
+                    utterance.onstart = () => {
+                        audioBtn.innerHTML = '⏸️ Pause';
+                        audioBtn.classList.add('playing');
+                        isPlaying = true;
+                    };
 
-                // Clear other buttons
-                document.querySelectorAll('.blog-audio-btn-text.playing').forEach(btn => {
-                    if (btn !== audioBtn) {
-                        btn.innerHTML = '🎧 Listen';
-                        btn.classList.remove('playing');
-                    }
-                });
+                    utterance.onend = () => {
+                        audioBtn.innerHTML = '🎧 Listen';
+                        audioBtn.classList.remove('playing');
+                        isPlaying = false;
+                    };
 
-                if (!isPlaying) {
-                    // Try to play MP3
-                    const playPromise = audio.play();
-
-                    if (playPromise !== undefined) {
-                        playPromise.then(() => {
-                            audioBtn.innerHTML = '⏸️ Pause';
-                            audioBtn.classList.add('playing');
-                            isPlaying = true;
-                            window.currentBlogAudio = audio;
-                        }).catch(err => {
-                            console.log('Audio play failed, switching to TTS:', err);
-                            useTTS();
-                        });
-                    }
-                } else {
-                    // Pause/Stop
-                    audio.pause();
-                    window.speechSynthesis.cancel(); // Also stop TTS if active
-                    audioBtn.innerHTML = '🎧 Listen';
-                    audioBtn.classList.remove('playing');
-                    isPlaying = false;
+                    window.speechSynthesis.speak(utterance);
                 }
-            });
 
-            // View button (Read More)
-            const viewBtn = card.querySelector('.blog-read-more');
-            viewBtn.addEventListener('click', function (e) {
-                e.stopPropagation();
-                openBlogModal(post);
-            });
+                audio.onerror = () => {
+                    console.log('Audio file missing event');
+                    // We don't auto-play here on load, just note it. 
+                    // The click handler will fail play() and trigger fallback.
+                };
 
-            card.addEventListener('click', function (e) {
-                if (!e.target.classList.contains('blog-audio-btn')) {
+                audioBtn.addEventListener('click', function (e) {
+                    e.stopPropagation();
                     e.preventDefault();
+
+                    // Stop any other visual/audio state
+                    if (window.currentBlogAudio && window.currentBlogAudio !== audio) {
+                        window.currentBlogAudio.pause();
+                        window.currentBlogAudio.currentTime = 0;
+                    }
+
+                    // Clear other buttons
+                    document.querySelectorAll('.blog-audio-btn-text.playing').forEach(btn => {
+                        if (btn !== audioBtn) {
+                            btn.innerHTML = '🎧 Listen';
+                            btn.classList.remove('playing');
+                        }
+                    });
+
+                    if (!isPlaying) {
+                        // Try to play MP3
+                        const playPromise = audio.play();
+
+                        if (playPromise !== undefined) {
+                            playPromise.then(() => {
+                                audioBtn.innerHTML = '⏸️ Pause';
+                                audioBtn.classList.add('playing');
+                                isPlaying = true;
+                                window.currentBlogAudio = audio;
+                            }).catch(err => {
+                                console.log('Audio play failed, switching to TTS:', err);
+                                useTTS();
+                            });
+                        }
+                    } else {
+                        // Pause/Stop
+                        audio.pause();
+                        window.speechSynthesis.cancel(); // Also stop TTS if active
+                        audioBtn.innerHTML = '🎧 Listen';
+                        audioBtn.classList.remove('playing');
+                        isPlaying = false;
+                    }
+                });
+
+                // View button (Read More)
+                const viewBtn = card.querySelector('.blog-read-more');
+                viewBtn.addEventListener('click', function (e) {
+                    e.stopPropagation();
                     openBlogModal(post);
-                }
-            });
+                });
 
-            blogGrid.appendChild(card);
-        });
+                card.addEventListener('click', function (e) {
+                    if (!e.target.classList.contains('blog-audio-btn')) {
+                        e.preventDefault();
+                        openBlogModal(post);
+                    }
+                });
 
-        // Add "View Archives" card at the end
-        const archivedCount = window.archivedBlogPosts.length;
-        if (archivedCount > 0) {
-            const viewAllCard = document.createElement('div');
-            viewAllCard.className = 'blog-card view-all-card';
-            viewAllCard.innerHTML = `
-                <div class="view-all-content">
-                    <span class="view-all-icon">📚</span>
-                    <h3>Archives</h3>
-                    <p>Browse ${archivedCount} more research articles in our archives.</p>
-                    <span class="view-all-btn">Explore Archives →</span>
-                </div>
-            `;
-            viewAllCard.addEventListener('click', function (e) {
-                e.preventDefault();
-                openArchivesModal();
+                blogGrid.appendChild(card);
             });
-            blogGrid.appendChild(viewAllCard);
+
+            // Add "View Archives" card at the end
+            const archivedCount = window.archivedBlogPosts.length;
+            if (archivedCount > 0) {
+                const viewAllCard = document.createElement('div');
+                viewAllCard.className = 'blog-card view-all-card';
+                viewAllCard.innerHTML = `
+                    <div class="view-all-content">
+                        <span class="view-all-icon">📚</span>
+                        <h3>Archives</h3>
+                        <p>Browse ${archivedCount} more research articles in our archives.</p>
+                        <span class="view-all-btn">Explore Archives →</span>
+                    </div>
+                `;
+                viewAllCard.addEventListener('click', function (e) {
+                    e.preventDefault();
+                    openArchivesModal();
+                });
+                blogGrid.appendChild(viewAllCard);
+            }
         }
-    }
+    });
 
     // Text-to-Speech Functionality
     let speechSynth = window.speechSynthesis;
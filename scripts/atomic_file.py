@@ -0,0 +1,52 @@
+"""
+Atomic File Writes
+
+One helper for every file the pipeline rewrites in place (the blog store
+and site files, manifests, caches, audio, Drive tokens):
+
+    atomic_write_bytes(path, data)
+
+writes to a unique temp file (tempfile.mkstemp) next to the target,
+fsyncs it and renames it over the target. Readers see the old file or the
+new one, never a partial write, and concurrent writers (threads or
+processes) each use their own temp file. The temp file is removed if the
+write fails.
+"""
+
+import contextlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+
+def atomic_write_bytes(path, data, mode=None):
+    """
+    Write bytes to path via a temp file in the same directory and a rename.
+
+    Args:
+        path: Target file
+        data: Bytes to write
+        mode: Permission bits for the file; by default an existing file
+              keeps its mode and a new one gets 0644
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        # mkstemp creates 0600 files; most of these are served by the website
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        elif path.exists():
+            shutil.copymode(path, tmp_name)
+        else:
+            os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
@@ -0,0 +1,743 @@
+"""
+Shared Blog Post Store
+
+Single place where blog posts are read and written. The daily researcher,
+the Drive uploader, the weekly summary and the visuals generator all go
+through this module.
+
+Source of truth is data/blog-posts.jsonl: one JSON object per post, one
+post per line, oldest first. Everything the website loads is generated
+from it:
+
+    js/blog-posts.js              the `blogPosts` array (newest first)
+    js/blog/index.json            listing index (id, title, date, category, excerpt)
+    js/blog/posts/YYYY-MM.json    full post bodies, one shard per month
+
+Reading posts is a json.loads() per line, so quotes in an excerpt or
+backticks in the content no longer break anything. The in-process cache is
+keyed on the store's mtime and size, so an unchanged store is never read
+twice in one run.
+
+Between processes, a compact JSON index (scripts/.cache/blog_index.json)
+maps each post id to its date, category, byte range and content hash. It is
+only rebuilt when the store's hash changes; single-post and date-range
+lookups then seek straight to the matching lines.
+
+New posts go in through add_posts(), which holds an exclusive file lock,
+appends to the store and regenerates the JS file and shards with atomic
+renames, so overlapping runs (cron plus the GitHub Action) cannot lose
+posts or leave a half-written array behind.
+"""
+
+import bisect
+import contextlib
+import datetime
+import hashlib
+import json
+import os
+import re
+import threading
+import textwrap
+from pathlib import Path
+
+from atomic_file import atomic_write_bytes
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, rely on the atomic rename
+    fcntl = None
+
+SCRIPT_DIR = Path(__file__).parent
+STORE_PATH = SCRIPT_DIR.parent / "data" / "blog-posts.jsonl"
+BLOG_FILE_PATH = SCRIPT_DIR.parent / "js" / "blog-posts.js"
+SHARD_DIR = SCRIPT_DIR.parent / "js" / "blog"
+CACHE_DIR = SCRIPT_DIR / ".cache"
+INDEX_PATH = CACHE_DIR / "blog_index.json"
+INDEX_VERSION = 2
+LOCK_PATH = CACHE_DIR / "blog-posts.lock"
+INSERT_MARKER = "// INSERT_NEW_POST_HERE"
+
+DATE_FORMAT = "%B %d, %Y"
+
+POST_FIELDS = ('id', 'title', 'date', 'category', 'author', 'excerpt', 'content')
+
+
+class BlogPost:
+    """A single blog post record.
+
+    Supports both attribute access (``post.title``) and the mapping-style
+    access (``post['title']``) the scripts have always used.
+    """
+
+    __slots__ = ('id', 'title', 'date', 'category', 'author', 'excerpt', 'content')
+
+    def __init__(self, id, title, date, category, author, excerpt, content):
+        self.id = id
+        self.title = title
+        self.date = date
+        self.category = category
+        self.author = author
+        self.excerpt = excerpt
+        self.content = content
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a post from a dict, ignoring unknown keys."""
+        return cls(**{field: data.get(field, "") for field in cls.__slots__})
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        """Dict-style ``get`` for code that treats posts as mappings."""
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self):
+        """Return the post as a plain dict."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self):
+        return f"BlogPost(id={self.id!r}, date={self.date!r}, category={self.category!r})"
+
+
+# Process-wide read cache: (path, mtime_ns, size) -> list of BlogPost
+_cache = {'key': None, 'posts': []}
+_cache_lock = threading.RLock()
+
+# Process-wide copy of the persisted index, same key as above
+_index_cache = {'key': None, 'index': None}
+
+
+def _iso_date(date_str):
+    """Convert a post date ("January 05, 2026") to ISO format, or None."""
+    try:
+        return datetime.datetime.strptime(date_str, DATE_FORMAT).date().isoformat()
+    except ValueError:
+        return None
+
+
+def _iter_lines(data):
+    """Yield (offset, line_bytes) for every non-empty line of the store."""
+    offset = 0
+    for line in data.splitlines(keepends=True):
+        if line.strip():
+            yield offset, line
+        offset += len(line)
+
+
+def _decode_line(line):
+    """Parse one store line into a BlogPost, or None if it is damaged."""
+    try:
+        return BlogPost.from_dict(json.loads(line))
+    except (ValueError, TypeError) as e:
+        print(f"Skipping unreadable blog store line: {e}")
+        return None
+
+
+def _file_key(path):
+    path = Path(path)
+    stat = path.stat()
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size), stat
+
+
+def _ensure_store(path):
+    """Create the store from blog-posts.js the first time it is needed."""
+    path = Path(path)
+    if not path.exists() and path == STORE_PATH and BLOG_FILE_PATH.exists():
+        import_from_js()
+
+
+def load_posts(path=STORE_PATH):
+    """
+    Load all blog posts, reading the store only if it changed.
+
+    Args:
+        path: Path to the JSON Lines store (defaults to data/blog-posts.jsonl)
+
+    Returns:
+        list[BlogPost]: Posts newest first (the order the website shows them)
+    """
+    _ensure_store(path)
+    key, _ = _file_key(path)
+
+    with _cache_lock:
+        if _cache['key'] != key:
+            with open(path, 'rb') as f:
+                data = f.read()
+            posts = [_decode_line(line) for _, line in _iter_lines(data)]
+            _cache['posts'] = [p for p in reversed(posts) if p is not None]
+            _cache['key'] = key
+        return list(_cache['posts'])
+
+
+def parse_blog_posts():
+    """Get all blog posts, newest first (cached per process)."""
+    return load_posts()
+
+
+def clear_cache():
+    """Forget the cached posts and index (e.g. after editing the store by hand)."""
+    with _cache_lock:
+        _cache['key'] = None
+        _cache['posts'] = []
+        _index_cache['key'] = None
+        _index_cache['index'] = None
+
+
+def _write_if_changed(path, data):
+    """Write bytes only if they differ from what is on disk."""
+    try:
+        if Path(path).read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+def _build_index(data):
+    """Scan the store once and record where every post lives."""
+    entries = []
+    for offset, line in _iter_lines(data):
+        post = _decode_line(line)
+        if post is None:
+            continue
+        entries.append({
+            'id': post.id,
+            'date': _iso_date(post.date),
+            'category': post.category,
+            'offset': offset,
+            'length': len(line),
+            'hash': hashlib.sha1(line).hexdigest()[:16],
+        })
+    return entries
+
+
+def _write_index(index):
+    """Persist the index atomically next to the other script caches."""
+    atomic_write_bytes(INDEX_PATH, json.dumps(index, separators=(',', ':')).encode('utf-8'))
+
+
+def _read_index():
+    """Load the persisted index, or None if missing/unreadable."""
+    try:
+        with open(INDEX_PATH, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get('version') != INDEX_VERSION:
+        return None
+    return index
+
+
+def load_index(path=STORE_PATH):
+    """
+    Get the post index for the store, rebuilding it only when needed.
+
+    The stored mtime/size is checked first; if they differ, the store is
+    hashed and the index is rebuilt only if the hash changed too.
+
+    Returns:
+        dict: {'source', 'sha256', 'mtime_ns', 'size', 'posts': [...]}
+    """
+    _ensure_store(path)
+    key, stat = _file_key(path)
+    source = key[0]
+
+    with _cache_lock:
+        if _index_cache['key'] == key:
+            return _index_cache['index']
+
+        index = _read_index()
+        fresh = (
+            index is not None and index.get('source') == source
+            and index.get('mtime_ns') == stat.st_mtime_ns
+            and index.get('size') == stat.st_size
+        )
+        if not fresh:
+            with open(path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            if index is None or index.get('source') != source or index.get('sha256') != digest:
+                index = {
+                    'version': INDEX_VERSION,
+                    'source': source,
+                    'sha256': digest,
+                    'posts': _build_index(data),
+                }
+            index['mtime_ns'] = stat.st_mtime_ns
+            index['size'] = stat.st_size
+            try:
+                _write_index(index)
+            except OSError as e:
+                print(f"Could not save blog index: {e}")
+
+        # Lookup views: by id, and date-sorted for range queries
+        dated = sorted(
+            (entry for entry in index['posts'] if entry['date']),
+            key=lambda entry: entry['date']
+        )
+        index['_by_id'] = {entry['id']: entry for entry in index['posts']}
+        index['_dates'] = [entry['date'] for entry in dated]
+        index['_by_date'] = dated
+
+        _index_cache['key'] = key
+        _index_cache['index'] = index
+        return index
+
+
+def _read_entries(path, entries):
+    """Read and decode only the store lines of the given index entries."""
+    posts = []
+    with open(path, 'rb') as f:
+        for entry in entries:
+            f.seek(entry['offset'])
+            post = _decode_line(f.read(entry['length']))
+            if post is not None:
+                posts.append(post)
+    return posts
+
+
+def get_post(post_id, path=STORE_PATH):
+    """Get a single post by id (one seek + one json.loads), or None."""
+    entry = load_index(path)['_by_id'].get(post_id)
+    if entry is None:
+        return None
+    posts = _read_entries(path, [entry])
+    return posts[0] if posts else None
+
+
+def get_posts_between(start_date, end_date, path=STORE_PATH):
+    """
+    Get posts dated between start_date and end_date (inclusive).
+
+    Args:
+        start_date: datetime.date or datetime.datetime
+        end_date: datetime.date or datetime.datetime
+
+    Returns:
+        list[BlogPost]: Matching posts, newest first
+    """
+    if isinstance(start_date, datetime.datetime):
+        start_date = start_date.date()
+    if isinstance(end_date, datetime.datetime):
+        end_date = end_date.date()
+
+    index = load_index(path)
+    dates = index['_dates']
+    lo = bisect.bisect_left(dates, start_date.isoformat())
+    hi = bisect.bisect_right(dates, end_date.isoformat())
+    entries = sorted(index['_by_date'][lo:hi], key=lambda entry: entry['offset'], reverse=True)
+    return _read_entries(path, entries)
+
+
+def get_posts_on(date, path=STORE_PATH):
+    """Get posts published on a single date."""
+    return get_posts_between(date, date, path)
+
+
+# flock() is per open file, so nesting it in one process would deadlock;
+# the RLock serializes threads and lets the owning thread re-enter.
+_write_lock = threading.RLock()
+_write_lock_state = {'depth': 0, 'file': None}
+
+
+@contextlib.contextmanager
+def blog_file_lock():
+    """Hold an exclusive (re-entrant) lock on the blog store for a write."""
+    with _write_lock:
+        if _write_lock_state['depth'] == 0:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            lock_file = open(LOCK_PATH, 'a')
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            _write_lock_state['file'] = lock_file
+        _write_lock_state['depth'] += 1
+        try:
+            yield
+        finally:
+            _write_lock_state['depth'] -= 1
+            if _write_lock_state['depth'] == 0:
+                lock_file = _write_lock_state.pop('file')
+                _write_lock_state['file'] = None
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                lock_file.close()
+
+
+def _encode_line(post):
+    return (json.dumps(post.to_dict(), ensure_ascii=False) + "\n").encode('utf-8')
+
+
+def _js_string(value):
+    """Render a JS string literal (JSON strings are valid JS)."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _js_template(value):
+    """Render a JS template literal, escaping anything it would interpret."""
+    return value.replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${')
+
+
+def render_js(posts):
+    """
+    Render the `blogPosts` array for js/blog-posts.js.
+
+    Args:
+        posts: Posts newest first
+
+    Returns:
+        str: JavaScript source
+    """
+    entries = []
+    for post in posts:
+        content = textwrap.indent(_js_template(post.content), '            ').lstrip()
+        entries.append(f"""    {{
+        id: {_js_string(post.id)},
+        title: {_js_string(post.title)},
+        date: {_js_string(post.date)},
+        category: {_js_string(post.category)},
+        author: {_js_string(post.author)},
+        excerpt: {_js_string(post.excerpt)},
+        content: `
+            {content}
+        `
+    }}""")
+    body = ",\n\n".join(entries)
+    return f"const blogPosts = [\n    {INSERT_MARKER}\n\n{body}\n];\n"
+
+
+def export_js(path=BLOG_FILE_PATH, store_path=STORE_PATH):
+    """Regenerate js/blog-posts.js from the store. Returns True if it changed."""
+    return _write_if_changed(path, render_js(load_posts(store_path)).encode('utf-8'))
+
+
+def export_shards(out_dir=SHARD_DIR, store_path=STORE_PATH):
+    """
+    Write the website listing index and per-month content shards.
+
+    Output:
+        <out_dir>/index.json          [{id, title, date, category, excerpt, shard}, ...]
+        <out_dir>/posts/YYYY-MM.json  [{id, title, date, category, author, excerpt, content}, ...]
+
+    Posts are newest first. Undated posts go into posts/undated.json.
+    Unchanged files are not rewritten, and shards for months that no longer
+    have posts are removed.
+
+    Returns:
+        dict: {'posts': int, 'shards': int, 'written': int}
+    """
+    out_dir = Path(out_dir)
+    posts_dir = out_dir / "posts"
+
+    listing = []
+    shards = {}
+    for post in load_posts(store_path):
+        iso = _iso_date(post.date)
+        month = iso[:7] if iso else "undated"
+        shard = f"posts/{month}.json"
+        listing.append({
+            'id': post.id, 'title': post.title, 'date': post.date,
+            'category': post.category, 'excerpt': post.excerpt, 'shard': shard,
+        })
+        shards.setdefault(month, []).append(post.to_dict())
+
+    def dump(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    written = int(_write_if_changed(out_dir / "index.json", dump(listing)))
+    for month, month_posts in shards.items():
+        written += int(_write_if_changed(posts_dir / f"{month}.json", dump(month_posts)))
+
+    for stale in posts_dir.glob("*.json"):
+        if stale.stem not in shards:
+            stale.unlink()
+            written += 1
+
+    print(f"✅ Blog shards: {len(listing)} posts in {len(shards)} shards ({written} files updated)")
+    return {'posts': len(listing), 'shards': len(shards), 'written': written}
+
+
+def publish(store_path=STORE_PATH):
+    """Regenerate every website artifact (blog-posts.js and shards) from the store."""
+    if export_js(store_path=store_path):
+        print("✅ Regenerated blog-posts.js")
+    export_shards(store_path=store_path)
+
+
+def add_posts(posts, store_path=STORE_PATH, publish_site=True, new_id=None):
+    """
+    Append new posts to the store and regenerate the website files.
+
+    Runs under blog_file_lock(), so concurrent runs serialize. Posts whose
+    id is already in the store are skipped.
+
+    Args:
+        posts: Iterable of BlogPost or dicts with the post fields
+        store_path: Path to the JSON Lines store
+        publish_site: Regenerate blog-posts.js and shards afterwards
+        new_id: Called as new_id(taken_ids) for each post without an id,
+                while the lock is held, so generated ids can't collide
+                with posts another run stores in the meantime
+
+    Returns:
+        list[BlogPost]: The posts that were actually added
+    """
+    records = [p if isinstance(p, BlogPost) else BlogPost.from_dict(p) for p in posts]
+
+    with blog_file_lock():
+        _ensure_store(store_path)
+        existing = set(load_index(store_path)['_by_id']) if Path(store_path).exists() else set()
+        if new_id is not None:
+            taken = existing | {p.id for p in records if p.id}
+            for post in records:
+                if not post.id:
+                    post.id = new_id(taken)
+                    taken.add(post.id)
+        added = [p for p in records if p.id not in existing]
+        for post in records:
+            if post.id in existing:
+                print(f"Skipping duplicate post id: {post.id}")
+
+        if added:
+            Path(store_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(store_path, 'ab') as f:
+                for post in added:
+                    f.write(_encode_line(post))
+                f.flush()
+                os.fsync(f.fileno())
+
+        if publish_site:
+            publish(store_path)
+
+    return added
+
+
+_JS_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+
+
+class _JSReader:
+    """
+    Tokenizer for the `blogPosts` array literal in blog-posts.js.
+
+    Understands exactly what a (hand-edited) blog-posts.js may contain:
+    object literals with bare or quoted keys, "double", 'single' and
+    `template` strings with JS escapes, comments and trailing commas.
+    Anything else raises ValueError with the line number, so a bad edit
+    can never turn into silently dropped posts.
+    """
+
+    def __init__(self, text, pos=0):
+        self.text = text
+        self.pos = pos
+
+    def error(self, message):
+        line = self.text.count('\n', 0, self.pos) + 1
+        raise ValueError(f"blog-posts.js line {line}: {message}")
+
+    def skip(self):
+        """Skip whitespace and comments."""
+        text = self.text
+        while self.pos < len(text):
+            if text[self.pos].isspace():
+                self.pos += 1
+            elif text.startswith('//', self.pos):
+                end = text.find('\n', self.pos)
+                self.pos = len(text) if end == -1 else end + 1
+            elif text.startswith('/*', self.pos):
+                end = text.find('*/', self.pos + 2)
+                if end == -1:
+                    self.error("unterminated comment")
+                self.pos = end + 2
+            else:
+                break
+
+    def peek(self):
+        self.skip()
+        return self.text[self.pos] if self.pos < len(self.text) else ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            self.error(f"expected {char!r}, found {self.peek() or 'end of file'!r}")
+        self.pos += 1
+
+    def string(self):
+        """Read a quoted or template string literal at the current position."""
+        quote = self.peek()
+        if quote not in '"\'`':
+            self.error(f"expected a string, found {quote or 'end of file'!r}")
+        text = self.text
+        self.pos += 1
+        chars = []
+        while True:
+            if self.pos >= len(text):
+                self.error("unterminated string")
+            char = text[self.pos]
+            if char == quote:
+                self.pos += 1
+                return ''.join(chars)
+            if char == '\n' and quote != '`':
+                self.error("line break inside a quoted string")
+            if char == '$' and quote == '`' and text.startswith('${', self.pos):
+                self.error("${...} interpolation is not supported in post content")
+            if char != '\\':
+                chars.append(char)
+                self.pos += 1
+                continue
+            # Escape sequence
+            esc = text[self.pos + 1:self.pos + 2]
+            self.pos += 2
+            if esc in _JS_ESCAPES:
+                chars.append(_JS_ESCAPES[esc])
+            elif esc == 'x':
+                chars.append(chr(int(text[self.pos:self.pos + 2], 16)))
+                self.pos += 2
+            elif esc == 'u' and text.startswith('{', self.pos):
+                end = text.index('}', self.pos)
+                chars.append(chr(int(text[self.pos + 1:end], 16)))
+                self.pos = end + 1
+            elif esc == 'u':
+                code = int(text[self.pos:self.pos + 4], 16)
+                self.pos += 4
+                # Surrogate pair, as json.dumps(ensure_ascii=True) would write
+                if 0xD800 <= code < 0xDC00 and text.startswith('\\u', self.pos):
+                    low = int(text[self.pos + 2:self.pos + 6], 16)
+                    if 0xDC00 <= low < 0xE000:
+                        code = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+                        self.pos += 6
+                chars.append(chr(code))
+            elif esc == '\n':
+                pass  # line continuation
+            elif esc == '':
+                self.error("unterminated string")
+            else:
+                chars.append(esc)  # \" \' \` \$ \\ and other identity escapes
+
+    def key(self):
+        if self.peek() in '"\'':
+            return self.string()
+        start = self.pos
+        while self.pos < len(self.text) and (self.text[self.pos].isalnum() or self.text[self.pos] in '_$'):
+            self.pos += 1
+        if start == self.pos:
+            self.error(f"expected a property name, found {self.peek() or 'end of file'!r}")
+        return self.text[start:self.pos]
+
+    def post(self):
+        """Read one post object literal."""
+        self.expect('{')
+        fields = {}
+        while self.peek() != '}':
+            name = self.key()
+            self.expect(':')
+            is_template = self.peek() == '`'
+            value = self.string()
+            if is_template:
+                # Template literals are indented to match the surrounding code
+                value = textwrap.dedent(value).strip()
+            fields[name] = value
+            if self.peek() != ',':
+                break
+            self.pos += 1
+        self.expect('}')
+
+        missing = [name for name in POST_FIELDS if name not in fields]
+        if missing:
+            self.error(f"post {fields.get('id', '?')!r} is missing {', '.join(missing)}")
+        return BlogPost(**{name: fields[name] for name in POST_FIELDS})
+
+
+def parse_js(text):
+    """
+    Parse the posts out of blog-posts.js source.
+
+    Returns:
+        list: BlogPost objects, in file order (newest first)
+
+    Raises:
+        ValueError: The file isn't a well-formed `blogPosts` array
+    """
+    start = re.search(r'\bblogPosts\s*=\s*\[', text)
+    if not start:
+        raise ValueError("blog-posts.js: no `blogPosts = [` array found")
+    reader = _JSReader(text, start.end())
+    posts = []
+    while reader.peek() != ']':
+        posts.append(reader.post())
+        if reader.peek() != ',':
+            break
+        reader.pos += 1
+    reader.expect(']')
+    return posts
+
+
+def import_from_js(js_path=BLOG_FILE_PATH, store_path=STORE_PATH, force=False):
+    """
+    (Re)build the store from a blog-posts.js file.
+
+    Used once to migrate the existing site, and afterwards whenever
+    someone edits blog-posts.js by hand.
+
+    Args:
+        js_path: blog-posts.js to read
+        store_path: Store to replace
+        force: Replace the store even if that would drop posts
+
+    Returns:
+        int: Number of posts imported
+
+    Raises:
+        ValueError: The file can't be parsed, or it has fewer posts than
+            the store and force is False
+    """
+    with open(js_path, 'r', encoding='utf-8') as f:
+        posts = parse_js(f.read())
+
+    # The JS file is newest first; the store is append-ordered (oldest first)
+    data = b"".join(_encode_line(post) for post in reversed(posts))
+    with blog_file_lock():
+        if not force and Path(store_path).exists():
+            existing = len(load_posts(store_path))
+            if len(posts) < existing:
+                raise ValueError(
+                    f"{js_path} has {len(posts)} posts but {store_path} has {existing}; "
+                    "not replacing the store (use --force to import anyway)"
+                )
+        atomic_write_bytes(store_path, data)
+    clear_cache()
+    print(f"✅ Imported {len(posts)} posts into {store_path}")
+    return len(posts)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Blog post store utilities")
+    parser.add_argument('--import-js', action='store_true',
+                        help='Rebuild data/blog-posts.jsonl from a hand-edited js/blog-posts.js')
+    parser.add_argument('--export-shards', action='store_true',
+                        help='Regenerate js/blog-posts.js, js/blog/index.json and content shards')
+    parser.add_argument('--rebuild-index', action='store_true',
+                        help='Force a rebuild of the persisted post index')
+    parser.add_argument('--force', action='store_true',
+                        help='With --import-js: replace the store even if posts would be dropped')
+
+    args = parser.parse_args()
+
+    if args.import_js:
+        try:
+            import_from_js(force=args.force)
+        except ValueError as e:
+            parser.exit(1, f"❌ {e}\n")
+    if args.rebuild_index:
+        with contextlib.suppress(OSError):
+            INDEX_PATH.unlink()
+        index = load_index()
+        print(f"✅ Indexed {len(index['posts'])} posts")
+    if args.export_shards or args.import_js or not args.rebuild_index:
+        with blog_file_lock():
+            publish()
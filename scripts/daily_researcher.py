@@ -1,9 +1,20 @@
 import os
+import argparse
 import datetime
 import json
 import random
 import re
-import textwrap
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from blog_store import add_posts
+from disk_cache import DiskCache, make_key
+import gemini_client
+import http_pool
+from resilience import call_with_retry
 
 # You need these libraries: 
 # pip install google-generativeai duckduckgo-search
@@ -23,7 +34,6 @@ except ImportError as e:
 
 # Configuration
 API_KEY = os.environ.get("GEMINI_API_KEY")
-BLOG_FILE_PATH = "js/blog-posts.js"
 
 TOPICS = [
     "AI in Agriculture India",
@@ -35,16 +45,84 @@ TOPICS = [
     "AI for Disabilities India"
 ]
 
-def search_web(query):
-    """Searches the web for recent results."""
+# Upper bound on concurrent search + Gemini calls in multi-topic mode
+MAX_WORKERS = int(os.environ.get("RESEARCH_MAX_WORKERS", "4"))
+
+# Search result cache (scripts/.cache/search): retries and backfills reuse results
+SEARCH_REGION = 'in-en'
+SEARCH_TIMELIMIT = 'm'
+SEARCH_MAX_RESULTS = 5
+SEARCH_TIMEOUT = int(os.environ.get("SEARCH_TIMEOUT", "15"))       # seconds per request
+SEARCH_DEADLINE = float(os.environ.get("SEARCH_DEADLINE", "60"))  # seconds including retries
+SEARCH_CACHE_TTL = float(os.environ.get("SEARCH_CACHE_TTL_HOURS", "24")) * 3600
+SEARCH_CACHE_MAX_ENTRIES = int(os.environ.get("SEARCH_CACHE_MAX_ENTRIES", "200"))
+SEEN_HREF_TTL = 30 * 24 * 3600
+
+search_cache = DiskCache("search", ttl=SEARCH_CACHE_TTL, max_entries=SEARCH_CACHE_MAX_ENTRIES)
+seen_hrefs_cache = DiskCache("search_seen")
+_seen_hrefs_lock = threading.Lock()
+
+FALLBACK_RESULTS = [{"title": "General Knowledge", "body": "Uses general knowledge about AI impact.", "href": "#"}]
+
+def normalize_query(query):
+    """Lowercase and collapse whitespace so equivalent queries share a cache entry."""
+    return " ".join(query.lower().split())
+
+def dedupe_results(results):
+    """Drop results whose href was already seen, within this result list and
+    across earlier runs.
+
+    Articles already returned by a previous search (within SEEN_HREF_TTL)
+    are moved behind new ones rather than dropped, so a query never comes
+    back empty just because its results are familiar.
+    """
+    unique = {}
+    for r in results:
+        href = r.get('href')
+        if href and href not in unique:
+            unique[href] = r
+    
+    with _seen_hrefs_lock:
+        seen = seen_hrefs_cache.get("hrefs") or {}
+        now = datetime.datetime.now().timestamp()
+        seen = {h: t for h, t in seen.items() if now - t < SEEN_HREF_TTL}
+        
+        fresh = [r for h, r in unique.items() if h not in seen]
+        repeats = [r for h, r in unique.items() if h in seen]
+        for href in unique:
+            seen.setdefault(href, now)
+        seen_hrefs_cache.set("hrefs", seen)
+    return fresh + repeats
+
+def search_web(query, use_cache=True):
+    """Searches the web for recent results (cached on disk per query/region)."""
+    key = make_key(normalize_query(query), SEARCH_REGION, SEARCH_TIMELIMIT, SEARCH_MAX_RESULTS)
+    if use_cache:
+        cached = search_cache.get(key)
+        if cached is not None:
+            print(f"Searching for: {query}... (cached)")
+            return cached
+    
     print(f"Searching for: {query}...")
+    def ddgs_text():
+        # One search client per thread, reused so its connections stay open
+        ddgs = http_pool.thread_client('ddgs', lambda: DDGS(timeout=SEARCH_TIMEOUT))
+        try:
+            return list(ddgs.text(query, region=SEARCH_REGION, max_results=SEARCH_MAX_RESULTS, timelimit=SEARCH_TIMELIMIT))
+        except Exception:
+            # Start the retry on a fresh client and connection
+            http_pool.reset_thread_client('ddgs')
+            raise
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, region='in-en', max_results=5, timelimit='m'))
-            return results
+        results = call_with_retry(ddgs_text, name="search", deadline=SEARCH_DEADLINE)
     except Exception as e:
         print(f"Search failed: {e}")
         return []
+    
+    results = dedupe_results(results)
+    if results:
+        search_cache.set(key, results)
+    return results
 
 def generate_blog_content(topic, search_results):
     """Uses Gemini to generate the blog post content."""
@@ -52,10 +130,6 @@ def generate_blog_content(topic, search_results):
         print("Error: GEMINI_API_KEY environment variable not set.")
         return None
 
-    genai.configure(api_key=API_KEY)
-    print("Initializing GenerativeModel with: gemini-2.5-flash")
-    model = genai.GenerativeModel('gemini-2.5-flash')
-
     search_context = "\n".join([f"- {r['title']}: {r['body']} (Link: {r['href']})" for r in search_results])
     
     today = datetime.datetime.now().strftime("%B %d, %Y")
@@ -78,72 +152,157 @@ def generate_blog_content(topic, search_results):
     """
 
     print("Generating content with AI...")
-    response = model.generate_content(prompt, generation_config={"response_mime_type": "application/json"})
+    response_text = gemini_client.generate_text(
+        prompt,
+        generation_config={"response_mime_type": "application/json"},
+        # Not cached: the prompt only depends on topic + (cached) search results,
+        # so a cached response would republish an old post under a new id
+        cache=False
+    )
     
     try:
-        return json.loads(response.text)
+        return json.loads(response_text)
     except Exception as e:
         print(f"JSON parsing failed: {e}")
-        print("Raw response:", response.text)
+        print("Raw response:", response_text)
         return None
 
+# Fields a generated post must provide, all as strings
+GENERATED_FIELDS = ('title', 'category', 'excerpt', 'content')
+
+def new_post_id(taken_ids):
+    """Pick a random post-YYYYMMDD-NNN id that is not in taken_ids."""
+    while True:
+        id_str = f"post-{datetime.datetime.now().strftime('%Y%m%d')}-{random.randint(100,999)}"
+        if id_str not in taken_ids:
+            return id_str
+
+def make_post_record(post_data):
+    """
+    Turn generated content into a post record for the blog store.
+
+    The id is left empty; add_posts assigns one under the store lock.
+
+    Raises:
+        ValueError: The generated post is not an object with string
+                    title, category, excerpt and content
+    """
+    if not isinstance(post_data, dict):
+        raise ValueError(f"expected a JSON object, got {type(post_data).__name__}")
+    bad = [f for f in GENERATED_FIELDS if not isinstance(post_data.get(f), str) or not post_data[f].strip()]
+    if bad:
+        raise ValueError(f"missing or empty {', '.join(bad)}")
+
+    today_str = datetime.datetime.now().strftime("%B %d, %Y")
+    return {
+        'id': '',
+        'title': post_data['title'],
+        'date': today_str,
+        'category': post_data['category'],
+        'author': "VitaInspire AI",
+        'excerpt': post_data['excerpt'],
+        'content': post_data['content'].strip(),
+    }
+
 def update_blog_file(post_data):
-    """Updates the blog-posts.js file."""
+    """Adds one or more posts to the blog store and regenerates blog-posts.js.
+
+    Accepts a single generated post or a list of them; a list is written
+    in one batched, locked store update. Malformed posts are skipped.
+    """
     if not post_data:
-        return
+        return []
+    batch = post_data if isinstance(post_data, list) else [post_data]
 
-    today_str = datetime.datetime.now().strftime("%B %d, %Y")
-    id_str = f"post-{datetime.datetime.now().strftime('%Y%m%d')}-{random.randint(100,999)}"
-    
-    # Create the JS object string
-    new_entry = f"""
-    {{
-        id: "{id_str}",
-        title: "{post_data['title']}",
-        date: "{today_str}",
-        category: "{post_data['category']}",
-        author: "VitaInspire AI",
-        excerpt: "{post_data['excerpt']}",
-        content: `
-{textwrap.indent(post_data['content'], '            ')}
-        `
-    }},"""
+    records = []
+    for i, p in enumerate(batch, 1):
+        try:
+            records.append(make_post_record(p))
+        except ValueError as e:
+            print(f"Skipping malformed post {i} of {len(batch)}: {e}")
+    if not records:
+        return []
 
     try:
-        with open(BLOG_FILE_PATH, 'r') as f:
-            content = f.read()
-        
-        # Look for the insertion marker
-        marker = "// INSERT_NEW_POST_HERE"
-        if marker in content:
-            updated_content = content.replace(marker, f"{marker}\n{new_entry}")
-            
-            with open(BLOG_FILE_PATH, 'w') as f:
-                f.write(updated_content)
-            print("Successfully updated blog-posts.js")
+        # Locked append to data/blog-posts.jsonl, then blog-posts.js and shards are rebuilt;
+        # ids are picked inside the lock so overlapping runs can't collide
+        added = add_posts(records, new_id=new_post_id)
+        if added:
+            print(f"Successfully updated blog-posts.js ({len(added)} new post(s))")
         else:
-            print("Error: Insertion marker not found in blog-posts.js")
+            print("Error: Post was not added (duplicate id)")
+        return added
             
     except Exception as e:
         print(f"File update failed: {e}")
+        return []
 
-def main():
-    # 1. Pick a random topic to ensure variety
-    topic = random.choice(TOPICS)
-    
-    # 2. Search for recent news
-    search_results = search_web(f"latest {topic} case studies 2024 2025")
-    
-    if not search_results:
-        # Fallback if search fails
-        search_results = [{"title": "General Knowledge", "body": "Uses general knowledge about AI impact.", "href": "#"}]
+def research_topic(topic, use_cache=True):
+    """
+    Search and generate a post for one topic. Returns the content dict or None.
+
+    Errors are logged and swallowed, so one failed topic doesn't throw away
+    the (uncached) posts already generated for the others in the batch.
+    """
+    try:
+        search_results = search_web(f"latest {topic} case studies 2024 2025", use_cache=use_cache)
+
+        if not search_results:
+            # Fallback if search fails
+            search_results = FALLBACK_RESULTS
+
+        return generate_blog_content(topic, search_results)
+    except Exception as e:
+        print(f"Research failed for '{topic}': {e}")
+        return None
 
-    # 3. Generate content
-    content = generate_blog_content(topic, search_results)
+def pick_topics(count):
+    """Pick `count` topics, without repeats until every topic has been used."""
+    topics = random.sample(TOPICS, min(count, len(TOPICS)))
+    while len(topics) < count:
+        topics.append(random.choice(TOPICS))
+    return topics
+
+def main(num_topics=1, all_topics=False, max_workers=MAX_WORKERS, use_search_cache=True):
+    """
+    Generate new blog post(s) and add them to the blog.
+
+    Args:
+        num_topics: Number of topics to research in this run
+        all_topics: Research every entry in TOPICS (overrides num_topics)
+        max_workers: Max concurrent search/generation calls
+        use_search_cache: Reuse cached search results (see SEARCH_CACHE_TTL)
+
+    Returns:
+        list: The posts that were added
+    """
+    # 1. Pick random topic(s) to ensure variety
+    topics = list(TOPICS) if all_topics else pick_topics(max(1, num_topics))
+    
+    # 2-3. Search for recent news and generate content, topics in parallel
+    if len(topics) == 1:
+        contents = [research_topic(topics[0], use_search_cache)]
+    else:
+        print(f"Researching {len(topics)} topics with up to {max_workers} workers...")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(topics)))) as pool:
+            contents = list(pool.map(lambda t: research_topic(t, use_search_cache), topics))
     
-    # 4. Update file
-    if content:
-        update_blog_file(content)
+    # 4. Update file (one batched write for all topics)
+    contents = [c for c in contents if c]
+    if len(contents) < len(topics):
+        print(f"Warning: {len(topics) - len(contents)} of {len(topics)} topics produced no post")
+    return update_blog_file(contents)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate daily AI research blog posts")
+    parser.add_argument('--topics', type=int, default=1,
+                        help='Number of topics to research concurrently (default: 1)')
+    parser.add_argument('--all-topics', action='store_true',
+                        help='Research every topic in TOPICS')
+    parser.add_argument('--jobs', type=int, default=MAX_WORKERS,
+                        help=f'Max concurrent topics (default: {MAX_WORKERS})')
+    parser.add_argument('--no-search-cache', action='store_true',
+                        help='Ignore cached search results and query the web again')
+    args = parser.parse_args()
+    main(num_topics=args.topics, all_topics=args.all_topics, max_workers=args.jobs,
+         use_search_cache=not args.no_search_cache)
@@ -0,0 +1,109 @@
+"""
+Small On-Disk Cache
+
+JSON entries under scripts/.cache/<name>/, one file per key. Used by the
+pipeline scripts to avoid repeating network calls between runs.
+
+Each cache can have:
+    ttl          seconds before an entry is considered stale (None = forever)
+    max_entries  keep at most this many entries, least recently used go first
+    max_bytes    keep the total size under this many bytes, same LRU order
+
+Entries are written atomically (temp file + rename), so concurrent runs
+never see a half-written entry. "Recently used" is tracked through the
+entry file's mtime, which get() bumps on every hit.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from atomic_file import atomic_write_bytes
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_ROOT = SCRIPT_DIR / ".cache"
+
+
+def make_key(*parts):
+    """Stable hex key for any JSON-serializable parts."""
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class DiskCache:
+    """A directory of JSON cache entries with TTL and LRU eviction."""
+
+    def __init__(self, name, ttl=None, max_entries=None, max_bytes=None):
+        self.dir = CACHE_ROOT / name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return self.dir / f"{key}.json"
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self.ttl is not None and time.time() - entry.get('created', 0) > self.ttl:
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return None
+
+        # Mark as recently used for LRU eviction
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry.get('value')
+
+    def set(self, key, value):
+        """Store a JSON-serializable value under key."""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        entry = {'created': time.time(), 'value': value}
+        atomic_write_bytes(self._path(key), json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+        self.evict()
+
+    def delete(self, key):
+        with contextlib.suppress(OSError):
+            self._path(key).unlink()
+
+    def _entries(self):
+        """(mtime, size, path) for every entry, oldest use first."""
+        entries = []
+        for path in self.dir.glob("*.json"):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def evict(self):
+        """Drop least recently used entries beyond max_entries/max_bytes. Returns count removed."""
+        if self.max_entries is None and self.max_bytes is None:
+            return 0
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        while entries and (
+            (self.max_entries is not None and len(entries) > self.max_entries)
+            or (self.max_bytes is not None and total > self.max_bytes)
+        ):
+            _, size, path = entries.pop(0)
+            total -= size
+            with contextlib.suppress(OSError):
+                path.unlink()
+                removed += 1
+        return removed
+
+    def clear(self):
+        for _, _, path in self._entries():
+            with contextlib.suppress(OSError):
+                path.unlink()
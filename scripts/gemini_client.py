@@ -0,0 +1,187 @@
+"""
+Gemini Client Helpers
+
+Shared entry point for Gemini calls made by the daily researcher and the
+weekly summary generator.
+
+The API is configured once per process and one GenerativeModel per model
+name is created lazily and reused, so every call in a run_automation.py
+process shares the same client and connection. get_stats() reports how
+often the client was reused and how long API calls took.
+
+Responses are cached on disk (scripts/.cache/gemini), content-addressed by
+model name, prompt hash and generation config, so re-running a pipeline
+with identical inputs (e.g. after a failed Drive upload) costs nothing.
+Callers that need a fresh response for identical input (daily posts)
+pass cache=False.
+
+Environment variables:
+    GEMINI_API_KEY          API key
+    GEMINI_CACHE_MAX_MB     Size limit for the response cache (default 50)
+    GEMINI_CACHE_BYPASS     Set to 1 to always call the API (results are still stored)
+    GEMINI_TIMEOUT          Seconds per generate_content attempt (default 120)
+    GEMINI_DEADLINE         Seconds for all attempts incl. backoff (default 300)
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from disk_cache import DiskCache, make_key
+from resilience import call_with_retry
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
+
+API_KEY = os.environ.get("GEMINI_API_KEY")
+MODEL_NAME = 'gemini-2.5-flash'
+
+CACHE_MAX_BYTES = int(float(os.environ.get("GEMINI_CACHE_MAX_MB", "50")) * 1024 * 1024)
+CACHE_BYPASS = os.environ.get("GEMINI_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+REQUEST_TIMEOUT = float(os.environ.get("GEMINI_TIMEOUT", "120"))
+CALL_DEADLINE = float(os.environ.get("GEMINI_DEADLINE", "300"))
+
+response_cache = DiskCache("gemini", max_bytes=CACHE_MAX_BYTES)
+
+# One configured client per process
+_models = {}
+_models_lock = threading.Lock()
+_configured = False
+
+_stats_lock = threading.Lock()
+_stats = {
+    'client_inits': 0,      # GenerativeModel objects created
+    'client_hits': 0,       # calls that reused an existing model client
+    'cache_hits': 0,        # responses served from the disk cache
+    'api_calls': 0,         # generate_content round trips
+    'api_seconds': 0.0,     # total time spent in generate_content
+    'init_seconds': 0.0,    # total time spent configuring/creating clients
+}
+
+
+def _count(**increments):
+    with _stats_lock:
+        for name, value in increments.items():
+            _stats[name] += value
+
+
+def get_model(model_name=MODEL_NAME):
+    """
+    Get the shared GenerativeModel for model_name, creating it on first use.
+
+    Returns:
+        google.generativeai.GenerativeModel
+    """
+    global _configured
+    with _models_lock:
+        model = _models.get(model_name)
+        if model is not None:
+            _count(client_hits=1)
+            return model
+
+        if genai is None:
+            raise ImportError("google-generativeai is not installed. Run: pip install google-generativeai")
+
+        start = time.perf_counter()
+        if not _configured:
+            genai.configure(api_key=API_KEY)
+            _configured = True
+        print(f"Initializing GenerativeModel with: {model_name}")
+        model = genai.GenerativeModel(model_name)
+        _models[model_name] = model
+        _count(client_inits=1, init_seconds=time.perf_counter() - start)
+        return model
+
+
+def get_stats():
+    """Snapshot of client/cache counters, with average API latency."""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats['avg_api_seconds'] = stats['api_seconds'] / stats['api_calls'] if stats['api_calls'] else 0.0
+    return stats
+
+
+def print_stats():
+    """Print a one-line summary of Gemini usage in this process."""
+    stats = get_stats()
+    if not (stats['api_calls'] or stats['cache_hits']):
+        return
+    print(
+        f"🤖 Gemini: {stats['api_calls']} API call(s), avg {stats['avg_api_seconds']:.2f}s | "
+        f"{stats['cache_hits']} cache hit(s) | client reused {stats['client_hits']}x, "
+        f"created {stats['client_inits']}x ({stats['init_seconds']:.2f}s)"
+    )
+
+
+def set_cache_bypass(bypass=True):
+    """Turn the response cache bypass on or off for this process."""
+    global CACHE_BYPASS
+    CACHE_BYPASS = bypass
+
+
+def cache_key(prompt, generation_config=None, model_name=MODEL_NAME):
+    """Content address for a request: model, prompt hash and generation config."""
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    return make_key(model_name, prompt_hash, generation_config or {})
+
+
+def generate_text(prompt, generation_config=None, model_name=MODEL_NAME,
+                  validate=None, bypass=None, cache=True):
+    """
+    Generate text with Gemini, serving identical requests from the cache.
+
+    Args:
+        prompt: Prompt text
+        generation_config: Optional generation config dict
+        model_name: Gemini model name
+        validate: Optional callable run on the response text; the response
+            is only cached if it does not raise (e.g. json.loads)
+        bypass: Skip the cache lookup (defaults to GEMINI_CACHE_BYPASS)
+        cache: Use the response cache at all (False: no lookup, nothing stored)
+
+    Returns:
+        str: Response text
+    """
+    if bypass is None:
+        bypass = CACHE_BYPASS
+
+    key = cache_key(prompt, generation_config, model_name)
+    if cache and not bypass:
+        cached = response_cache.get(key)
+        if cached is not None:
+            _count(cache_hits=1)
+            print(f"Using cached {model_name} response")
+            return cached
+
+    model = get_model(model_name)
+
+    def attempt():
+        start = time.perf_counter()
+        try:
+            response = model.generate_content(
+                prompt,
+                generation_config=generation_config,
+                request_options={"timeout": REQUEST_TIMEOUT}
+            )
+            return response.text
+        finally:
+            _count(api_calls=1, api_seconds=time.perf_counter() - start)
+
+    text = call_with_retry(attempt, name="gemini", deadline=CALL_DEADLINE)
+
+    if not cache:
+        return text
+    try:
+        if validate:
+            validate(text)
+    except Exception:
+        # Don't cache responses the caller can't use
+        return text
+    response_cache.set(key, text)
+    return text
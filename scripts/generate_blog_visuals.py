@@ -3,40 +3,52 @@ Daily Blog Visual Generator
 
 Generates infographic images and audio files for each daily blog post.
 These are stored in assets/blog/ and can be displayed on the website.
+
+Covers are content-addressed: each unique image is stored once as
+assets/blog/infographics/shared/<hash>.png and manifest.json points every
+post at its shared file, so posts with the same header share one PNG.
+
+Each shared cover also gets smaller responsive variants (<hash>-<width>.webp
+and .png at COVER_WIDTHS), listed in the manifest for srcset / <picture>.
+
+Audio is encoded for speech (mono, AUDIO_BITRATE, loudness normalized; see
+tts_pipeline) and its duration is recorded in the manifest.
 """
 
+import hashlib
+import io
 import os
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 import json
+sys.path.insert(0, str(Path(__file__).parent))
+
+import tts_pipeline
+from atomic_file import atomic_write_bytes
+from blog_store import parse_blog_posts
 
 SCRIPT_DIR = Path(__file__).parent
-BLOG_FILE_PATH = SCRIPT_DIR.parent / "js" / "blog-posts.js"
-ASSETS_DIR = SCRIPT_DIR.parent / "assets" / "blog"
+SITE_ROOT = SCRIPT_DIR.parent
+ASSETS_DIR = SITE_ROOT / "assets" / "blog"
 INFOGRAPHICS_DIR = ASSETS_DIR / "infographics"
+SHARED_COVERS_DIR = INFOGRAPHICS_DIR / "shared"
 AUDIO_DIR = ASSETS_DIR / "audio"
+MANIFEST_PATH = ASSETS_DIR / "manifest.json"
+HEADER_IMAGES_DIR = SCRIPT_DIR.parent / "assets" / "images" / "blog_headers"
 
+# Covers are the header images resized to 1200x675. Resized copies are kept
+# in memory per process and in HEADER_BANK_DIR between runs.
+COVER_SIZE = (1200, 675)
+COVER_WIDTHS = (400, 800, 1200)
+WEBP_QUALITY = 80
+HEADER_BANK_DIR = SCRIPT_DIR / ".cache" / f"blog_headers_{COVER_SIZE[0]}x{COVER_SIZE[1]}"
+_header_bank = {}
 
-def parse_blog_posts():
-    """Parse blog posts from blog-posts.js."""
-    with open(BLOG_FILE_PATH, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    posts = []
-    pattern = re.compile(
-        r'\{\s*id:\s*"([^"]+)",\s*title:\s*"([^"]+)",\s*'
-        r'date:\s*"([^"]+)",\s*category:\s*"([^"]+)",\s*'
-        r'author:\s*"([^"]+)",\s*excerpt:\s*"([^"]+)",\s*'
-        r'content:\s*`([^`]+)`', re.DOTALL
-    )
-    
-    for m in pattern.finditer(content):
-        posts.append({
-            'id': m.group(1), 'title': m.group(2), 'date': m.group(3),
-            'category': m.group(4), 'author': m.group(5),
-            'excerpt': m.group(6), 'content': m.group(7).strip()
-        })
-    return posts
+# Asset hashes keyed by path, reused while a file's mtime and size are unchanged
+ASSET_HASHES_PATH = SCRIPT_DIR / ".cache" / "asset_hashes.json"
 
 
 def strip_html(text):
@@ -59,175 +71,560 @@ def get_category_colors():
         'default': '#37474F'      # Slate Grey
     }
 
-def create_blog_infographic(post, filename):
-    """Generate a clean 'Split Card' style infographic."""
-    try:
-        from PIL import Image, ImageDraw, ImageFont
-        import textwrap
-        import random
-        
-        # Landscape Aspect Ratio (approx 16:9) matching Wadhwani style headers
-        width, height = 1200, 675
-        
-        # Get category colors (Deep, professional tones)
-        from random import choice
-        
-        def get_theme_colors(category):
-            themes = {
-                'Health': ['#00695C', '#004D40', '#00897B', '#E0F2F1'],
-                'Education': ['#4527A0', '#311B92', '#5E35B1', '#EDE7F6'],
-                'Agriculture': ['#2E7D32', '#1B5E20', '#43A047', '#E8F5E9'],
-                'Environment': ['#33691E', '#1B5E20', '#558B2F', '#F1F8E9'],
-                'Technology': ['#1565C0', '#0D47A1', '#1976D2', '#E3F2FD'],
-                'Social Impact': ['#C62828', '#B71C1C', '#D32F2F', '#FFEBEE'],
-                'Governance': ['#EF6C00', '#E65100', '#F57C00', '#FFF3E0'],
-                'default': ['#37474F', '#263238', '#455A64', '#ECEFF1']
-            }
-            return themes.get(category, themes['default'])
-
-        colors = get_theme_colors(post['category'])
-        base_color = colors[0]
-        accent_color = colors[2]
-        
-        # Load Base Image based on Category
-        # Define Header Images Dir
-        header_images_dir = SCRIPT_DIR.parent / "assets" / "images" / "blog_headers"
+def get_theme_colors(category):
+    """Deep, professional tones per category: [base, dark, accent, light]."""
+    themes = {
+        'Health': ['#00695C', '#004D40', '#00897B', '#E0F2F1'],
+        'Education': ['#4527A0', '#311B92', '#5E35B1', '#EDE7F6'],
+        'Agriculture': ['#2E7D32', '#1B5E20', '#43A047', '#E8F5E9'],
+        'Environment': ['#33691E', '#1B5E20', '#558B2F', '#F1F8E9'],
+        'Technology': ['#1565C0', '#0D47A1', '#1976D2', '#E3F2FD'],
+        'Social Impact': ['#C62828', '#B71C1C', '#D32F2F', '#FFEBEE'],
+        'Governance': ['#EF6C00', '#E65100', '#F57C00', '#FFF3E0'],
+        'default': ['#37474F', '#263238', '#455A64', '#ECEFF1']
+    }
+    return themes.get(category, themes['default'])
 
-        # Load Base Image based on Category or Title keywords
-        text_to_check = (post['category'] + " " + post['title']).title()
-        
-        base_image_name = "technology_community.png" # Default
-        
-        if 'Woman' in text_to_check or 'Women' in text_to_check or 'Empowerment' in text_to_check or 'Gender' in text_to_check:
-             base_image_name = "woman_empowerment.png"
-        elif 'Health' in text_to_check:
-             base_image_name = "health.png"
-        elif 'Agriculture' in text_to_check:
-             base_image_name = "agriculture.png"
-        elif 'Education' in text_to_check or 'Learning' in text_to_check:
-             base_image_name = "education.png"
-        elif 'Governance' in text_to_check:
-             base_image_name = "governance.png"
-        elif 'Environment' in text_to_check or 'Climate' in text_to_check:
-             base_image_name = "environment.png"
-        elif 'Social' in text_to_check or 'Impact' in text_to_check:
-             base_image_name = "social_impact.png"
-        
-        base_image_path = header_images_dir / base_image_name
 
-        try:
-            img = Image.open(base_image_path).convert('RGB')
-            img = img.resize((width, height), Image.Resampling.LANCZOS)
-        except Exception as e:
-            print(f"Could not load base image {base_image_path}: {e}")
-            # Fallback to solid color
-            img = Image.new('RGB', (width, height), color=base_color)
-
-        # No text overlay - Clean Image
-        img.save(filename)
-        print(f"✅ Blog Cover: {filename}")
-        return True
+def select_header_image(post):
+    """Pick the header image for a post based on category or title keywords."""
+    text_to_check = (post['category'] + " " + post['title']).title()
+    
+    if 'Woman' in text_to_check or 'Women' in text_to_check or 'Empowerment' in text_to_check or 'Gender' in text_to_check:
+        return "woman_empowerment.png"
+    elif 'Health' in text_to_check:
+        return "health.png"
+    elif 'Agriculture' in text_to_check:
+        return "agriculture.png"
+    elif 'Education' in text_to_check or 'Learning' in text_to_check:
+        return "education.png"
+    elif 'Governance' in text_to_check:
+        return "governance.png"
+    elif 'Environment' in text_to_check or 'Climate' in text_to_check:
+        return "environment.png"
+    elif 'Social' in text_to_check or 'Impact' in text_to_check:
+        return "social_impact.png"
+    return "technology_community.png"  # Default
+
+
+def _render_header(source_path):
+    """Decode, LANCZOS-resize and PNG-encode one header image."""
+    from PIL import Image
+    img = Image.open(source_path).convert('RGB')
+    img = img.resize(COVER_SIZE, Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def get_header_bytes(image_name):
+    """
+    Get the cover-sized PNG for a header image.
+
+    Looks in memory first, then in the on-disk bank (rebuilt if the source
+    image is newer), and only decodes/resizes the source as a last resort.
+
+    Returns:
+        bytes or None if the source image can't be loaded
+    """
+    if image_name in _header_bank:
+        return _header_bank[image_name]
+
+    source_path = HEADER_IMAGES_DIR / image_name
+    bank_path = HEADER_BANK_DIR / image_name
+    try:
+        if bank_path.exists() and bank_path.stat().st_mtime >= source_path.stat().st_mtime:
+            data = bank_path.read_bytes()
+        else:
+            data = _render_header(source_path)
+            HEADER_BANK_DIR.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename: parallel workers may build the same entry
+            atomic_write_bytes(bank_path, data)
     except Exception as e:
-        print(f"Infographic generation failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        print(f"Could not load base image {source_path}: {e}")
+        return None
+
+    _header_bank[image_name] = data
+    return data
+
+
+def build_header_bank():
+    """Resize every header image once into the on-disk bank. Returns count ready."""
+    ready = 0
+    for source_path in sorted(HEADER_IMAGES_DIR.glob("*.png")):
+        if get_header_bytes(source_path.name) is not None:
+            ready += 1
+    return ready
+
+
+def site_path(path):
+    """Path relative to the website root, as used in manifest.json."""
+    return Path(path).relative_to(SITE_ROOT).as_posix()
+
+
+def store_cover(data):
+    """
+    Store cover image bytes once under their content hash.
+
+    Returns:
+        Path: assets/blog/infographics/shared/<hash>.png
+    """
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    path = SHARED_COVERS_DIR / f"{digest}.png"
+    if not path.exists():
+        SHARED_COVERS_DIR.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(path, data)
+    return path
+
+
+def cover_variants(cover_path):
+    """
+    Ensure the responsive WebP/PNG variants of a shared cover exist.
+
+    Variants are named after the cover's hash, so they are only ever
+    rendered once per unique image.
+
+    Args:
+        cover_path: Shared full-size cover (shared/<hash>.png)
+
+    Returns:
+        dict: {'webp': [{'width': 400, 'src': ...}, ...], 'png': [...]}
+    """
+    from PIL import Image
+    cover_path = Path(cover_path)
+    variants = {'webp': [], 'png': []}
+    img = None
+
+    for width in COVER_WIDTHS:
+        for fmt in ('webp', 'png'):
+            if fmt == 'png' and width == COVER_SIZE[0]:
+                # The full-size PNG is the cover itself
+                path = cover_path
+            else:
+                path = cover_path.with_name(f"{cover_path.stem}-{width}.{fmt}")
+            if not path.exists():
+                if img is None:
+                    img = Image.open(cover_path).convert('RGB')
+                height = round(img.height * width / img.width)
+                resized = img if width == img.width else img.resize((width, height), Image.Resampling.LANCZOS)
+                buffer = io.BytesIO()
+                if fmt == 'webp':
+                    resized.save(buffer, format='WEBP', quality=WEBP_QUALITY, method=6)
+                else:
+                    resized.save(buffer, format='PNG', optimize=True)
+                atomic_write_bytes(path, buffer.getvalue())
+            variants[fmt].append({'width': width, 'src': site_path(path)})
+
+    return variants
+
+
+def create_blog_cover(post):
+    """
+    Generate a clean cover image for a post in the shared cover store.
+
+    Returns:
+        dict: Manifest fields ('infographic' and 'infographic_variants')
+
+    Raises:
+        Exception: Whatever rendering or storing the cover failed with, so
+                   the run summary can report the cause
+    """
+    # Landscape Aspect Ratio (approx 16:9) matching Wadhwani style headers
+    data = get_header_bytes(select_header_image(post))
+
+    if data is None:
+        # Fallback to solid color
+        from PIL import Image
+        base_color = get_theme_colors(post['category'])[0]
+        img = Image.new('RGB', COVER_SIZE, color=base_color)
+        buffer = io.BytesIO()
+        img.save(buffer, format='PNG')
+        data = buffer.getvalue()
+
+    # No text overlay - Clean Image, so identical headers dedupe to one file
+    cover_path = store_cover(data)
+    cover = site_path(cover_path)
+    print(f"✅ Blog Cover: {post['id']} -> {cover}")
+    return {'infographic': cover, 'infographic_variants': cover_variants(cover_path)}
 
 
 def create_blog_audio(post, filename):
-    """Generate audio file for a blog post."""
+    """
+    Generate audio file for a blog post.
+
+    Raises:
+        ImportError: No TTS backend is available (with an install hint)
+        Exception: Whatever synthesis or encoding failed with
+    """
+    content_clean = strip_html(post['content'])
+
+    # Build audio script; intro, body and outro are segmented separately
+    # so the shared outro is synthesized once and then served from cache
+    intro = f"{post['title']}. Category: {post['category']}. By {post['author']}."
+    body = f"{post['excerpt']} {content_clean[:1500]}"
+    outro = "This article was brought to you by VitaInspire, building AI careers and transforming social impact."
+
     try:
-        from gtts import gTTS
-        
-        content_clean = strip_html(post['content'])
-        
-        # Build audio script
-        script = f"""
-        {post['title']}.
-        
-        Category: {post['category']}.
-        By {post['author']}.
-        
-        {post['excerpt']}
-        
-        {content_clean[:1500]}
-        
-        This article was brought to you by VitaInspire, building AI careers and transforming social impact.
-        """
-        
-        tts = gTTS(text=script, lang='en', slow=False)
-        tts.save(filename)
-        print(f"✅ Audio: {filename}")
-        return True
-        
-    except ImportError:
-        print("gTTS not installed. Run: pip install gtts")
-        return False
-    except Exception as e:
-        print(f"Audio generation failed: {e}")
-        return False
+        tts_pipeline.synthesize([intro, body, outro], filename, encode=True)
+    except ImportError as e:
+        raise ImportError(f"{e}. Run: pip install gtts (or set TTS_BACKEND=espeak for offline audio)") from e
+    print(f"✅ Audio: {filename}")
+    return True
+
+
+def _run_asset_tasks(tasks, jobs=1):
+    """
+    Run (kind, post, path) asset tasks and collect results.
+
+    With jobs > 1, covers (CPU-bound Pillow work) go to a process pool and
+    audio (network-bound gTTS calls) to a thread pool, both `jobs` wide.
+
+    Returns:
+        tuple: (generated counts dict, {post_id: cover manifest fields},
+                list of (kind, post_id, error) failures)
+    """
+    generated = {'infographics': 0, 'audio': 0}
+    covers = {}
+    failures = []
+    total = len(tasks)
+    start = time.monotonic()
+
+    def submit(pool_for, kind, post, path):
+        if kind == 'infographics':
+            return pool_for(kind)(create_blog_cover, post)
+        return pool_for(kind)(create_blog_audio, post, str(path))
+
+    def record(done, kind, post_id, result, error=None):
+        if result:
+            generated[kind] += 1
+            if kind == 'infographics':
+                covers[post_id] = result
+        else:
+            failures.append((kind, post_id, error))
+        status = "✓" if result else "✗"
+        print(f"[{done}/{total}] {status} {kind}: {post_id} ({time.monotonic() - start:.1f}s)")
+
+    if jobs <= 1:
+        call_now = lambda kind: (lambda fn, *args: fn(*args))
+        for done, (kind, post, path) in enumerate(tasks, 1):
+            try:
+                record(done, kind, post['id'], submit(call_now, kind, post, path))
+            except Exception as e:
+                record(done, kind, post['id'], None, f"{type(e).__name__}: {e}")
+        return generated, covers, failures
+
+    with ProcessPoolExecutor(max_workers=jobs) as processes, \
+            ThreadPoolExecutor(max_workers=jobs) as threads:
+        pool_for = lambda kind: (processes if kind == 'infographics' else threads).submit
+        futures = {
+            submit(pool_for, kind, post, path): (kind, post['id'])
+            for kind, post, path in tasks
+        }
+
+        for done, future in enumerate(as_completed(futures), 1):
+            kind, post_id = futures[future]
+            try:
+                record(done, kind, post_id, future.result())
+            except Exception as e:
+                record(done, kind, post_id, None, f"{type(e).__name__}: {e}")
+
+    return generated, covers, failures
+
+
+def load_manifest():
+    """Load manifest.json, or an empty manifest if it doesn't exist yet."""
+    try:
+        with open(MANIFEST_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest):
+    """
+    Write manifest.json, skipping the write if the content is unchanged.
+
+    Returns:
+        bool: True if the file was written
+    """
+    data = json.dumps(manifest, indent=2).encode('utf-8')
+    try:
+        if hashlib.sha256(MANIFEST_PATH.read_bytes()).digest() == hashlib.sha256(data).digest():
+            return False
+    except OSError:
+        pass
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(MANIFEST_PATH, data)
+    return True
+
+
+def _load_asset_hashes():
+    try:
+        with open(ASSET_HASHES_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
 
+def asset_info(path, hashes, probe=False):
+    """
+    Size, short sha256 and (for audio) duration of an asset file.
+
+    Args:
+        path: Asset file
+        hashes: Hash cache from _load_asset_hashes(), updated in place
+        probe: Also get the duration with ffprobe
 
-def generate_blog_assets(post_ids=None, regenerate=False):
+    Returns:
+        tuple: (size in bytes, sha256 prefix, duration in seconds or None)
+    """
+    stat = path.stat()
+    key = site_path(path)
+    cached = hashes.get(key)
+    if not (cached and len(cached) == 4 and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size):
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+        cached = hashes[key] = [stat.st_mtime_ns, stat.st_size, digest, None]
+    if probe and cached[3] is None and stat.st_size:
+        info = tts_pipeline.probe_audio(path)
+        if info:
+            cached[3] = info['duration']
+    return stat.st_size, cached[2], cached[3]
+
+
+def has_cover(post_id, manifest):
+    """True if the post already has a cover (shared via manifest, or a legacy per-post PNG)."""
+    entry = manifest.get(post_id, {})
+    cover = entry.get('infographic')
+    if cover and (SITE_ROOT / cover).exists():
+        variants = entry.get('infographic_variants', {})
+        return bool(variants) and all(
+            (SITE_ROOT / v['src']).exists() for vs in variants.values() for v in vs
+        )
+    return (INFOGRAPHICS_DIR / f"{post_id}.png").exists()
+
+
+def record_covers(covers):
+    """Point manifest entries at their shared cover files and variants."""
+    if not covers:
+        return
+    manifest = load_manifest()
+    for post_id, fields in covers.items():
+        manifest.setdefault(post_id, {}).update(fields)
+        # A shared cover replaces any old per-post copy
+        legacy = INFOGRAPHICS_DIR / f"{post_id}.png"
+        if legacy.exists():
+            legacy.unlink()
+    save_manifest(manifest)
+
+
+def generate_blog_assets(post_ids=None, regenerate=False, jobs=1):
     """
     Generate infographic and audio for blog posts.
     
     Args:
         post_ids: List of post IDs to generate (None = all new posts)
         regenerate: If True, regenerate even if assets exist
+        jobs: Parallel workers (covers in processes, audio in threads)
     """
     # Create directories
-    INFOGRAPHICS_DIR.mkdir(parents=True, exist_ok=True)
+    SHARED_COVERS_DIR.mkdir(parents=True, exist_ok=True)
     AUDIO_DIR.mkdir(parents=True, exist_ok=True)
     
     posts = parse_blog_posts()
+    manifest = load_manifest()
     
     if post_ids:
         posts = [p for p in posts if p['id'] in post_ids]
     
-    generated = {'infographics': 0, 'audio': 0}
-    
+    tasks = []
     for post in posts:
         post_id = post['id']
         
-        # Infographic
-        infographic_path = INFOGRAPHICS_DIR / f"{post_id}.png"
-        if regenerate or not infographic_path.exists():
-            if create_blog_infographic(post, str(infographic_path)):
-                generated['infographics'] += 1
+        # Infographic (shared, content-addressed cover)
+        if regenerate or not has_cover(post_id, manifest):
+            tasks.append(('infographics', post, None))
         
         # Audio
         audio_path = AUDIO_DIR / f"{post_id}.mp3"
         if regenerate or not audio_path.exists():
-            if create_blog_audio(post, str(audio_path)):
-                generated['audio'] += 1
+            tasks.append(('audio', post, audio_path))
+    
+    if any(kind == 'infographics' for kind, _, _ in tasks):
+        # Resize each header once up front; covers are then plain copies
+        build_header_bank()
+    
+    generated, covers, failures = _run_asset_tasks(tasks, jobs)
+    record_covers(covers)
     
     print(f"\n📊 Generated {generated['infographics']} infographics, {generated['audio']} audio files")
+    if failures:
+        print(f"⚠️ {len(failures)} asset(s) failed:")
+        for kind, post_id, error in failures:
+            print(f"   - {kind} {post_id}: {error}")
+    generated['failed'] = failures
     return generated
 
 
-def generate_assets_manifest():
-    """Create a JSON manifest of available assets for the website."""
-    manifest = {}
+def sweep_shared_covers(manifest):
+    """
+    Delete shared covers and variants that no manifest entry references.
+
+    Returns:
+        int: Files removed
+    """
+    referenced = set()
+    for entry in manifest.values():
+        if entry.get('infographic'):
+            referenced.add(entry['infographic'])
+        for variants in entry.get('infographic_variants', {}).values():
+            referenced.update(v['src'] for v in variants)
+
+    removed = 0
+    for path in SHARED_COVERS_DIR.glob("*"):
+        # Skip in-flight temp files (.name.XXXX) from concurrent writers
+        if path.is_file() and not path.name.startswith('.') and site_path(path) not in referenced:
+            path.unlink()
+            removed += 1
+    if removed:
+        print(f"🧹 Removed {removed} unreferenced shared cover file(s)")
+    return removed
+
+
+def dedupe_covers():
+    """
+    Move every post's cover into the shared store, keyed on the current header bank.
+
+    Covers are re-rendered from the header bank exactly as create_blog_cover
+    would, so migrated and newly generated covers share the same files;
+    a legacy per-post PNG is only kept (by content hash) if its header
+    image can't be loaded. manifest.json is updated, per-post copies are
+    removed and unreferenced shared files are swept.
+
+    Returns:
+        tuple: (covers migrated, unique files)
+    """
+    manifest = load_manifest()
+    covers = {}
+    for post in parse_blog_posts():
+        post_id = post['id']
+        legacy = INFOGRAPHICS_DIR / f"{post_id}.png"
+        if not (legacy.exists() or manifest.get(post_id, {}).get('infographic')):
+            continue
+        data = get_header_bytes(select_header_image(post))
+        if data is None and legacy.exists():
+            data = legacy.read_bytes()
+        if data is None:
+            continue
+        cover_path = store_cover(data)
+        covers[post_id] = {
+            'infographic': site_path(cover_path),
+            'infographic_variants': cover_variants(cover_path),
+        }
+    record_covers(covers)
+    unique = len({fields['infographic'] for fields in covers.values()})
+    print(f"✅ Deduplicated {len(covers)} covers into {unique} shared files")
+    return len(covers), unique
+
+
+def compress_audio():
+    """
+    Re-encode existing audio for speech (mono, AUDIO_BITRATE, loudness normalized).
+
+    Files that are already mono at or below the target bitrate are skipped,
+    so running this again doesn't re-encode (and degrade) them.
+
+    Returns:
+        tuple: (files re-encoded, bytes saved)
+    """
+    target = tts_pipeline.bitrate_bps()
+    encoded, saved = 0, 0
+    for audio in sorted(AUDIO_DIR.glob("*.mp3")):
+        if not audio.stat().st_size:
+            continue
+        info = tts_pipeline.probe_audio(audio)
+        if info is None:
+            print(f"⚠️ Can't probe {audio.name} (is ffmpeg installed?), skipping")
+            continue
+        if info['channels'] == 1 and info['bit_rate'] <= target * 1.05:
+            continue
+        try:
+            data = tts_pipeline.encode_speech(audio.read_bytes(), 'mp3')
+        except Exception as e:
+            print(f"⚠️ Re-encoding {audio.name} failed: {e}")
+            continue
+        saved += audio.stat().st_size - len(data)
+        atomic_write_bytes(audio, data)
+        encoded += 1
+    print(f"✅ Re-encoded {encoded} audio file(s), saved {saved / 1024 / 1024:.1f} MB")
+    return encoded, saved
+
+
+def _scan_assets(previous):
+    """Current manifest entries for every post with assets on disk, without sizes/hashes."""
+    entries = {}
+    
+    # Shared covers are only known through the manifest itself
+    for post_id, entry in previous.items():
+        cover = entry.get('infographic')
+        if cover and cover.startswith(site_path(SHARED_COVERS_DIR)) and (SITE_ROOT / cover).exists():
+            entries.setdefault(post_id, {})['infographic'] = cover
+            if 'infographic_variants' in entry:
+                entries[post_id]['infographic_variants'] = entry['infographic_variants']
     
     for infographic in INFOGRAPHICS_DIR.glob("*.png"):
-        post_id = infographic.stem
-        if post_id not in manifest:
-            manifest[post_id] = {}
-        manifest[post_id]['infographic'] = f"assets/blog/infographics/{infographic.name}"
+        entries.setdefault(infographic.stem, {}).setdefault(
+            'infographic', f"assets/blog/infographics/{infographic.name}"
+        )
     
     for audio in AUDIO_DIR.glob("*.mp3"):
-        post_id = audio.stem
-        if post_id not in manifest:
-            manifest[post_id] = {}
-        manifest[post_id]['audio'] = f"assets/blog/audio/{audio.name}"
+        entries.setdefault(audio.stem, {})['audio'] = f"assets/blog/audio/{audio.name}"
+    
+    return entries
+
+
+def generate_assets_manifest():
+    """
+    Bring the JSON manifest of available assets up to date for the website.
+    
+    Only entries whose assets changed are replaced (each asset records its
+    size and hash), and manifest.json is left untouched when nothing changed,
+    so unchanged runs produce no git diff.
+    """
+    previous = load_manifest()
+    hashes = _load_asset_hashes()
+    hashes_before = json.dumps(hashes)
     
-    manifest_path = ASSETS_DIR / "manifest.json"
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    manifest = {}
+    changed = []
+    for post_id, entry in _scan_assets(previous).items():
+        for kind in ('infographic', 'audio'):
+            if kind in entry:
+                size, digest, duration = asset_info(SITE_ROOT / entry[kind], hashes, probe=(kind == 'audio'))
+                entry[f'{kind}_size'], entry[f'{kind}_sha256'] = size, digest
+                if duration is not None:
+                    entry['audio_duration'] = duration
+        if previous.get(post_id) == entry:
+            manifest[post_id] = previous[post_id]
+        else:
+            manifest[post_id] = entry
+            changed.append(post_id)
+    removed = [post_id for post_id in previous if post_id not in manifest]
+    
+    # Keep existing order so diffs only show changed entries
+    ordered = {post_id: manifest[post_id] for post_id in previous if post_id in manifest}
+    ordered.update(manifest)
+    
+    sweep_shared_covers(ordered)
     
-    print(f"✅ Manifest saved: {manifest_path}")
-    return manifest
+    if json.dumps(hashes) != hashes_before:
+        ASSET_HASHES_PATH.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(ASSET_HASHES_PATH, json.dumps(hashes).encode('utf-8'))
+    
+    if (changed or removed) and save_manifest(ordered):
+        print(f"✅ Manifest saved: {MANIFEST_PATH} ({len(changed)} updated, {len(removed)} removed)")
+    else:
+        print(f"✅ Manifest unchanged: {MANIFEST_PATH}")
+    return ordered
 
 
 if __name__ == "__main__":
@@ -237,15 +634,42 @@ if __name__ == "__main__":
     parser.add_argument('--all', action='store_true', help='Generate for all posts')
     parser.add_argument('--regenerate', action='store_true', help='Regenerate existing assets')
     parser.add_argument('--posts', nargs='+', help='Specific post IDs to generate')
+    parser.add_argument('--dedupe-covers', action='store_true',
+                        help='Re-key all covers from the header bank into the shared store, build variants and sweep unused files')
+    parser.add_argument('--build-header-bank', action='store_true',
+                        help='Only (re)build the resized header image cache')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Parallel workers: covers in processes, audio in threads (default: 1)')
+    parser.add_argument('--compress-audio', action='store_true',
+                        help='Re-encode existing audio as low-bitrate mono with loudness normalization')
+    parser.add_argument('--tts-backend',
+                        help='TTS backend(s) for audio, e.g. espeak or gtts,espeak (default: $TTS_BACKEND or gtts)')
     
     args = parser.parse_args()
     
+    if args.tts_backend:
+        tts_pipeline.set_backend(args.tts_backend)
+    
+    if args.build_header_bank:
+        print(f"✅ {build_header_bank()} header images ready in {HEADER_BANK_DIR}")
+        sys.exit(0)
+    
+    if args.compress_audio:
+        compress_audio()
+        generate_assets_manifest()
+        sys.exit(0)
+    
+    if args.dedupe_covers:
+        dedupe_covers()
+        generate_assets_manifest()
+        sys.exit(0)
+    
     if args.posts:
-        generate_blog_assets(post_ids=args.posts, regenerate=True)
+        generate_blog_assets(post_ids=args.posts, regenerate=True, jobs=args.jobs)
     elif args.all or args.regenerate:
-        generate_blog_assets(regenerate=args.regenerate)
+        generate_blog_assets(regenerate=args.regenerate, jobs=args.jobs)
     else:
         # Just generate for new posts (ones without assets)
-        generate_blog_assets(regenerate=False)
+        generate_blog_assets(regenerate=False, jobs=args.jobs)
     
     generate_assets_manifest()
@@ -15,46 +15,120 @@ First-time setup:
 
 Environment variables needed:
     GOOGLE_DRIVE_FOLDER_ID: The ID of the folder where files will be saved
+
+Optional:
+    DRIVE_REFRESH_FOLDERS: Set to 1 to ignore the cached folder IDs
+    DRIVE_CHUNK_MB: Chunk size for resumable uploads (default 5)
+    DRIVE_TOKEN_REFRESH_MARGIN: Refresh the token this many seconds before
+        it expires (default 600)
+
+Uploads are upserts: a file with the same name in the target folder is
+updated in place, or skipped if its md5Checksum already matches. Files
+larger than one chunk are uploaded resumably, chunk by chunk, so a
+dropped connection only repeats the current chunk.
 """
 
+import datetime
+import hashlib
+import json
 import os
 import pickle
+import threading
 from pathlib import Path
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 import io
 
-# If modifying these scopes, delete the token.pickle file
+import http_pool
+from atomic_file import atomic_write_bytes
+from resilience import call_with_retry
+
+# If modifying these scopes, delete the token.json file
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
 # Directory where credentials are stored
 SCRIPT_DIR = Path(__file__).parent
 CREDENTIALS_PATH = SCRIPT_DIR / 'credentials.json'
-TOKEN_PATH = SCRIPT_DIR / 'token.pickle'
+TOKEN_PATH = SCRIPT_DIR / 'token.json'
+LEGACY_TOKEN_PATH = SCRIPT_DIR / 'token.pickle'  # migrated to token.json on first use
 
+# Refresh the access token when it has less than this many seconds left
+TOKEN_REFRESH_MARGIN = float(os.environ.get("DRIVE_TOKEN_REFRESH_MARGIN", "600"))
 
-def get_google_drive_service():
+# Resolved folder IDs, reused between runs (see setup_vitainspire_folders)
+FOLDER_CACHE_PATH = SCRIPT_DIR / '.cache' / 'drive_folders.json'
+REFRESH_FOLDERS = os.environ.get("DRIVE_REFRESH_FOLDERS", "").lower() in ("1", "true", "yes")
+
+# Resumable upload chunk size (Drive requires a multiple of 256 KB)
+CHUNK_SIZE = max(1, round(float(os.environ.get("DRIVE_CHUNK_MB", "5")) * 4)) * 256 * 1024
+FILE_FIELDS = 'id, name, md5Checksum, webViewLink'
+
+# Max seconds for one Drive request including retries
+DRIVE_DEADLINE = float(os.environ.get("DRIVE_DEADLINE", "300"))
+
+
+def execute_request(request):
+    """Execute a Drive API request with retry/backoff and the Drive circuit breaker."""
+    return call_with_retry(request.execute, name="drive", deadline=DRIVE_DEADLINE)
+
+
+# Credentials shared by every service in this process
+_credentials = None
+_credentials_lock = threading.Lock()
+
+
+def _save_token(creds):
+    """Write token.json atomically, readable by the owner only."""
+    atomic_write_bytes(TOKEN_PATH, creds.to_json().encode('utf-8'), mode=0o600)
+
+
+def _load_token():
+    """Load token.json, migrating a legacy token.pickle on first use."""
+    if TOKEN_PATH.exists():
+        return Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
+    if LEGACY_TOKEN_PATH.exists():
+        with open(LEGACY_TOKEN_PATH, 'rb') as token:
+            creds = pickle.load(token)
+        _save_token(creds)
+        LEGACY_TOKEN_PATH.unlink()
+        print(f"Migrated {LEGACY_TOKEN_PATH.name} to {TOKEN_PATH.name}")
+        return creds
+    return None
+
+
+def _needs_refresh(creds):
+    """True if the token is expired or expires within TOKEN_REFRESH_MARGIN."""
+    if not creds.valid:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth keeps expiry as naive UTC
+    remaining = creds.expiry - datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    return remaining.total_seconds() < TOKEN_REFRESH_MARGIN
+
+
+def get_credentials():
     """
-    Get an authenticated Google Drive service instance.
+    Load (and if needed refresh or create) the OAuth credentials.
+    
+    Credentials are loaded once per process and refreshed ahead of expiry,
+    so no request ever waits on (or fails with) an expired token.
     
     Returns:
-        googleapiclient.discovery.Resource: Authenticated Drive service
+        google.oauth2.credentials.Credentials
     """
-    creds = None
-    
-    # Load existing token if available
-    if TOKEN_PATH.exists():
-        with open(TOKEN_PATH, 'rb') as token:
-            creds = pickle.load(token)
-    
-    # If no valid credentials, get new ones
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
+    global _credentials
+    with _credentials_lock:
+        creds = _credentials or _load_token()
+        
+        if creds and creds.refresh_token and _needs_refresh(creds):
+            creds.refresh(http_pool.get_auth_request())
+            _save_token(creds)
+        elif not creds or not creds.valid:
+            # No usable token: run the OAuth flow
             if not CREDENTIALS_PATH.exists():
                 raise FileNotFoundError(
                     f"Credentials file not found at {CREDENTIALS_PATH}. "
@@ -64,12 +138,50 @@ def get_google_drive_service():
                 str(CREDENTIALS_PATH), SCOPES
             )
             creds = flow.run_local_server(port=0)
+            
+            # Save the credentials for next run
+            _save_token(creds)
         
-        # Save the credentials for next run
-        with open(TOKEN_PATH, 'wb') as token:
-            pickle.dump(creds, token)
+        _credentials = creds
+        return creds
+
+
+# The service's httplib2 transport is not thread-safe: one service per thread
+_thread_local = threading.local()
+
+
+def get_google_drive_service():
+    """
+    Get an authenticated Google Drive service instance.
+    
+    The service is built once per thread (once per process for
+    single-threaded scripts) from the discovery document bundled with
+    google-api-python-client, so startup needs no discovery request.
     
-    return build('drive', 'v3', credentials=creds)
+    Returns:
+        googleapiclient.discovery.Resource: Authenticated Drive service
+    """
+    creds = get_credentials()
+    service = getattr(_thread_local, 'service', None)
+    if service is None:
+        # Keep-alive transport owned by this thread (see http_pool)
+        service = build('drive', 'v3', http=http_pool.get_drive_http(creds),
+                        static_discovery=True, cache_discovery=False)
+        _thread_local.service = service
+    return service
+
+
+def get_thread_service():
+    """
+    Get this thread's Drive service, building it on first use.
+    
+    Use this from worker threads (e.g. concurrent uploads) instead of
+    sharing one service object across threads.
+    
+    Returns:
+        googleapiclient.discovery.Resource: Authenticated Drive service
+    """
+    return get_google_drive_service()
 
 
 def get_or_create_folder(service, folder_name, parent_id=None):
@@ -89,11 +201,11 @@ def get_or_create_folder(service, folder_name, parent_id=None):
     if parent_id:
         query += f" and '{parent_id}' in parents"
     
-    results = service.files().list(
+    results = execute_request(service.files().list(
         q=query,
         spaces='drive',
         fields='files(id, name)'
-    ).execute()
+    ))
     
     files = results.get('files', [])
     
@@ -108,16 +220,77 @@ def get_or_create_folder(service, folder_name, parent_id=None):
     if parent_id:
         file_metadata['parents'] = [parent_id]
     
-    folder = service.files().create(
+    folder = execute_request(service.files().create(
         body=file_metadata,
         fields='id'
-    ).execute()
+    ))
     
     print(f"Created folder: {folder_name}")
     return folder.get('id')
 
 
-def upload_file_to_drive(service, file_path, folder_id, mime_type=None):
+MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.html': 'text/html',
+    '.json': 'application/json',
+    '.txt': 'text/plain',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.mp3': 'audio/mpeg',
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+}
+
+
+def find_file(service, file_name, folder_id):
+    """
+    Find a (non-trashed) file by name in a folder.
+    
+    Returns:
+        dict: File metadata (id, name, md5Checksum, webViewLink), or None
+    """
+    escaped = file_name.replace('\\', '\\\\').replace("'", "\\'")
+    results = execute_request(service.files().list(
+        q=f"name='{escaped}' and '{folder_id}' in parents and trashed=false",
+        spaces='drive',
+        fields=f'files({FILE_FIELDS})'
+    ))
+    files = results.get('files', [])
+    return files[0] if files else None
+
+
+def _upload(service, media, file_name, folder_id, md5, size, upsert):
+    """Create or update file_name in folder_id from media, skipping unchanged content."""
+    existing = find_file(service, file_name, folder_id) if upsert else None
+    if existing and existing.get('md5Checksum') == md5:
+        print(f"Unchanged, skipped upload: {file_name} -> {existing.get('webViewLink')}")
+        return existing
+    
+    if existing:
+        request = service.files().update(fileId=existing['id'], media_body=media, fields=FILE_FIELDS)
+    else:
+        request = service.files().create(
+            body={'name': file_name, 'parents': [folder_id]},
+            media_body=media,
+            fields=FILE_FIELDS
+        )
+    
+    if media.resumable():
+        # Each chunk is retried on its own; a retry resumes where the upload stopped
+        file = None
+        while file is None:
+            status, file = call_with_retry(request.next_chunk, name="drive", deadline=DRIVE_DEADLINE)
+            if status and file is None:
+                print(f"   {file_name}: {status.progress() * 100:.0f}% of {size / 1024 / 1024:.1f} MB")
+    else:
+        file = execute_request(request)
+    
+    action = "Updated" if existing else "Uploaded"
+    print(f"{action}: {file_name} -> {file.get('webViewLink')}")
+    return file
+
+
+def upload_file_to_drive(service, file_path, folder_id, mime_type=None, upsert=True):
     """
     Upload a file to Google Drive.
     
@@ -126,46 +299,31 @@ def upload_file_to_drive(service, file_path, folder_id, mime_type=None):
         file_path: Path to the file to upload
         folder_id: Target folder ID
         mime_type: Optional MIME type (auto-detected if not provided)
+        upsert: Update a same-named file in the folder instead of adding a
+            copy (and skip the upload if its content is unchanged)
         
     Returns:
         dict: File metadata including ID and webViewLink
     """
     file_path = Path(file_path)
-    file_name = file_path.name
     
     if mime_type is None:
-        extension = file_path.suffix.lower()
-        mime_types = {
-            '.pdf': 'application/pdf',
-            '.html': 'text/html',
-            '.json': 'application/json',
-            '.txt': 'text/plain',
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.mp3': 'audio/mpeg',
-            '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-        }
-        mime_type = mime_types.get(extension, 'application/octet-stream')
-    
-    file_metadata = {
-        'name': file_name,
-        'parents': [folder_id]
-    }
+        mime_type = MIME_TYPES.get(file_path.suffix.lower(), 'application/octet-stream')
     
-    media = MediaFileUpload(str(file_path), mimetype=mime_type)
+    md5 = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            md5.update(block)
+    size = file_path.stat().st_size
     
-    file = service.files().create(
-        body=file_metadata,
-        media_body=media,
-        fields='id, name, webViewLink'
-    ).execute()
-    
-    print(f"Uploaded: {file_name} -> {file.get('webViewLink')}")
-    return file
+    media = MediaFileUpload(
+        str(file_path), mimetype=mime_type,
+        chunksize=CHUNK_SIZE, resumable=size > CHUNK_SIZE
+    )
+    return _upload(service, media, file_path.name, folder_id, md5.hexdigest(), size, upsert)
 
 
-def upload_content_to_drive(service, content, file_name, folder_id, mime_type='text/html'):
+def upload_content_to_drive(service, content, file_name, folder_id, mime_type='text/html', upsert=True):
     """
     Upload content directly to Google Drive (without saving to local file first).
     
@@ -175,6 +333,8 @@ def upload_content_to_drive(service, content, file_name, folder_id, mime_type='t
         file_name: Name for the file
         folder_id: Target folder ID
         mime_type: MIME type of the content
+        upsert: Update a same-named file in the folder instead of adding a
+            copy (and skip the upload if its content is unchanged)
         
     Returns:
         dict: File metadata including ID and webViewLink
@@ -182,27 +342,63 @@ def upload_content_to_drive(service, content, file_name, folder_id, mime_type='t
     if isinstance(content, str):
         content = content.encode('utf-8')
     
-    file_metadata = {
-        'name': file_name,
-        'parents': [folder_id]
-    }
-    
     media = MediaIoBaseUpload(
         io.BytesIO(content),
-        mimetype=mime_type
+        mimetype=mime_type,
+        chunksize=CHUNK_SIZE,
+        resumable=len(content) > CHUNK_SIZE
     )
-    
-    file = service.files().create(
-        body=file_metadata,
-        media_body=media,
-        fields='id, name, webViewLink'
-    ).execute()
-    
-    print(f"Uploaded: {file_name} -> {file.get('webViewLink')}")
-    return file
+    return _upload(service, media, file_name, folder_id,
+                   hashlib.md5(content).hexdigest(), len(content), upsert)
+
+
+def _load_folder_cache():
+    try:
+        with open(FOLDER_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_folder_cache(cache):
+    atomic_write_bytes(FOLDER_CACHE_PATH, json.dumps(cache, indent=2).encode('utf-8'))
+
+
+def _folder_exists(service, folder_id):
+    """One cheap files().get: False if the folder is gone (404) or trashed."""
+    try:
+        folder = execute_request(service.files().get(fileId=folder_id, fields='id, trashed'))
+    except HttpError as e:
+        if e.resp.status == 404:
+            return False
+        raise
+    return not folder.get('trashed', False)
+
+
+def _cached_folders_valid(service, cached):
+    """
+    Check every cached folder ID in two requests.
+
+    The main folder is checked with files().get; all sub-folders with one
+    files().list of the live folders inside the main and weekly folders.
+
+    Returns:
+        bool: False if any cached folder is gone, trashed or moved
+    """
+    if not _folder_exists(service, cached['main']):
+        return False
+    parents = ' or '.join(f"'{cached[key]}' in parents" for key in ('main', 'weekly'))
+    results = execute_request(service.files().list(
+        q=f"mimeType='application/vnd.google-apps.folder' and trashed=false and ({parents})",
+        spaces='drive',
+        fields='files(id)',
+        pageSize=1000
+    ))
+    live = {f['id'] for f in results.get('files', [])}
+    return all(folder_id in live for key, folder_id in cached.items() if key != 'main')
 
 
-def setup_vitainspire_folders(service, root_folder_id=None):
+def setup_vitainspire_folders(service, root_folder_id=None, force_refresh=False):
     """
     Create the folder structure for VitaInspire reports.
     
@@ -215,13 +411,26 @@ def setup_vitainspire_folders(service, root_folder_id=None):
             ├── Slide Decks/
             └── Infographics/
     
+    The resolved IDs are cached in scripts/.cache/drive_folders.json. Later
+    runs check that every cached folder still exists (two requests) and
+    resolve the whole tree again if any of them was deleted or trashed.
+    
     Args:
         service: Google Drive service instance
         root_folder_id: Optional parent folder ID (uses root if not provided)
+        force_refresh: Ignore the cache and look up every folder again
         
     Returns:
         dict: Dictionary with folder IDs
     """
+    cache = _load_folder_cache()
+    cache_key = root_folder_id or 'root'
+    cached = cache.get(cache_key)
+    if cached and not (force_refresh or REFRESH_FOLDERS):
+        if _cached_folders_valid(service, cached):
+            return dict(cached)
+        print("Cached Drive folders are gone, looking them up again...")
+    
     folders = {}
     
     # Main folder
@@ -241,15 +450,23 @@ def setup_vitainspire_folders(service, root_folder_id=None):
     folders['weekly_slides'] = get_or_create_folder(service, "Slide Decks", weekly_folder_id)
     folders['weekly_infographics'] = get_or_create_folder(service, "Infographics", weekly_folder_id)
     
+    cache[cache_key] = folders
+    _save_folder_cache(cache)
     return folders
 
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Test the Google Drive connection and folder setup")
+    parser.add_argument('--refresh-folders', action='store_true',
+                        help='Ignore the cached folder IDs and look every folder up again')
+    args = parser.parse_args()
+    
     # Test the connection
     print("Testing Google Drive connection...")
     try:
         service = get_google_drive_service()
-        folders = setup_vitainspire_folders(service)
+        folders = setup_vitainspire_folders(service, force_refresh=args.refresh_folders)
         print("\n✅ Google Drive setup complete!")
         print("\nFolder IDs:")
         for name, folder_id in folders.items():
@@ -0,0 +1,96 @@
+"""
+Reused HTTP Clients
+
+Keeps the pipeline's network clients alive between calls, so a run pays
+for each connection and TLS handshake once per thread instead of per
+request. This is client reuse, not a tunable shared pool: every client
+here keeps its own keep-alive connections.
+
+    get_drive_http(creds)      this thread's authorized httplib2 transport
+                               for googleapiclient (httplib2 is not
+                               thread-safe, so one per thread)
+    thread_client(name, make)  any other client, one per thread and reused
+                               (e.g. the DuckDuckGo search client, which
+                               manages its own HTTP session)
+    get_session()              one requests.Session for the process, used
+                               for Google OAuth token refreshes
+    get_auth_request()         google.auth Request on that session
+
+Not covered: Gemini (google-generativeai) talks gRPC over its own
+HTTP/2 channel, which lives inside the shared client from
+gemini_client.get_model() and can't take an external transport.
+
+Environment variables:
+    HTTP_TIMEOUT            Socket timeout in seconds for Drive (default 60)
+"""
+
+import os
+import threading
+
+HTTP_TIMEOUT = float(os.environ.get("HTTP_TIMEOUT", "60"))
+
+_session = None
+_session_lock = threading.Lock()
+_thread_local = threading.local()
+
+
+def get_session():
+    """
+    The process-wide requests.Session (thread-safe for token refreshes).
+
+    Returns:
+        requests.Session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            _session = requests.Session()
+        return _session
+
+
+def get_auth_request():
+    """google.auth transport Request that reuses the process session (for token refreshes)."""
+    from google.auth.transport.requests import Request
+    return Request(session=get_session())
+
+
+def thread_client(name, make):
+    """
+    Get this thread's client called `name`, creating it with make() on first use.
+
+    Returns:
+        Whatever make() returns
+    """
+    clients = getattr(_thread_local, 'clients', None)
+    if clients is None:
+        clients = _thread_local.clients = {}
+    if name not in clients:
+        clients[name] = make()
+    return clients[name]
+
+
+def reset_thread_client(name):
+    """Drop this thread's client (e.g. after a connection error) so the next call builds a new one."""
+    client = getattr(_thread_local, 'clients', {}).pop(name, None)
+    close = getattr(client, 'close', None)
+    if callable(close):
+        try:
+            close()
+        except Exception:
+            pass
+
+
+def get_drive_http(creds):
+    """
+    This thread's authorized httplib2 transport for googleapiclient.
+
+    Returns:
+        google_auth_httplib2.AuthorizedHttp
+    """
+    def make():
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+        return AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+
+    return thread_client('drive', make)
@@ -0,0 +1,206 @@
+"""
+Retry / Circuit Breaker Helpers
+
+Shared resilience layer for the network calls the pipeline makes (web
+search, Gemini, Google Drive). A single transient error should cost one
+retry, not a fallback post or a full pipeline rerun.
+
+    call_with_retry(fn, *args, name="gemini", **kwargs)
+
+retries fn with jittered exponential backoff ("full jitter") until it
+succeeds, the attempts run out or the per-call deadline would be passed.
+Every name has its own circuit breaker: after several consecutive failed
+calls (each counted once, after its retries are used up) the breaker
+opens and further calls fail fast with CircuitOpenError until the reset
+timeout has passed.
+
+Errors that will not go away on retry (HTTP 4xx other than 408/429,
+missing credentials, bad arguments) are raised immediately.
+
+print_report() shows attempts, failures and time spent per name.
+"""
+
+import random
+import threading
+import time
+
+DEFAULT_ATTEMPTS = 4
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 20.0
+FAILURE_THRESHOLD = 3
+RESET_TIMEOUT = 60.0
+
+NON_RETRYABLE = (FileNotFoundError, ImportError, KeyError, TypeError, ValueError)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is refused because its circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half-open)."""
+
+    def __init__(self, name, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def allow(self):
+        """True if a call may go through (closed, or half-open trial)."""
+        with self._lock:
+            return self._state() != 'open'
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold or self._state() == 'half-open':
+                self.opened_at = time.monotonic()
+
+
+_breakers = {}
+_stats = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(name):
+    """Get (or create) the circuit breaker for a named dependency."""
+    with _registry_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
+
+
+def _record(name, **increments):
+    with _registry_lock:
+        stats = _stats.setdefault(name, {
+            'calls': 0, 'attempts': 0, 'retries': 0, 'failures': 0,
+            'short_circuited': 0, 'seconds': 0.0,
+        })
+        for key, value in increments.items():
+            stats[key] += value
+
+
+def is_retryable(exc):
+    """Guess whether an exception is transient."""
+    if isinstance(exc, CircuitOpenError) or isinstance(exc, NON_RETRYABLE):
+        return False
+    # googleapiclient HttpError (resp.status), google.api_core (code), requests (response.status_code)
+    status = getattr(getattr(exc, 'resp', None), 'status', None)
+    if status is None:
+        status = getattr(exc, 'code', None)
+    if status is None:
+        status = getattr(getattr(exc, 'response', None), 'status_code', None)
+    try:
+        status = int(status)
+    except (TypeError, ValueError):
+        return True
+    return status in (408, 429) or status >= 500
+
+
+def backoff_delay(attempt, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY):
+    """Full-jitter exponential backoff for the given (0-based) retry number."""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def call_with_retry(fn, *args, name, attempts=DEFAULT_ATTEMPTS, base_delay=DEFAULT_BASE_DELAY,
+                    max_delay=DEFAULT_MAX_DELAY, deadline=None, retryable=is_retryable, **kwargs):
+    """
+    Call fn(*args, **kwargs), retrying transient failures.
+
+    Args:
+        fn: Callable to invoke
+        name: Dependency name for the circuit breaker and report (e.g. "gemini")
+        attempts: Max attempts including the first
+        base_delay / max_delay: Backoff bounds in seconds
+        deadline: Max total seconds for all attempts and waits (None = no limit)
+        retryable: Predicate deciding whether an exception is worth retrying
+
+    Returns:
+        Whatever fn returns
+
+    Raises:
+        CircuitOpenError: The breaker for `name` is open
+        Exception: The last error from fn once retries are exhausted
+    """
+    breaker = get_breaker(name)
+    start = time.monotonic()
+    _record(name, calls=1)
+
+    try:
+        # The breaker gates whole calls; retries within a call always run
+        if not breaker.allow():
+            _record(name, short_circuited=1)
+            raise CircuitOpenError(f"{name}: circuit open after repeated failures, skipping call")
+
+        for attempt in range(attempts):
+            _record(name, attempts=1)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                transient = retryable(e)
+                give_up = attempt == attempts - 1 or not transient
+                if not give_up:
+                    delay = backoff_delay(attempt, base_delay, max_delay)
+                    if deadline is not None and time.monotonic() - start + delay > deadline:
+                        print(f"⚠️ {name}: {e} (deadline of {deadline:.0f}s reached, giving up)")
+                        give_up = True
+                if give_up:
+                    _record(name, failures=1)
+                    if transient:
+                        # One failure per failed call; permanent errors (404, bad
+                        # input) say nothing about the service's health
+                        breaker.record_failure()
+                    raise
+
+                print(f"⚠️ {name}: {e} - retrying in {delay:.1f}s ({attempt + 1}/{attempts - 1})")
+                _record(name, retries=1)
+                time.sleep(delay)
+            else:
+                breaker.record_success()
+                return result
+    finally:
+        _record(name, seconds=time.monotonic() - start)
+
+
+def get_report():
+    """Per-name call statistics plus breaker state."""
+    with _registry_lock:
+        report = {name: dict(stats) for name, stats in _stats.items()}
+        breakers = dict(_breakers)
+    for name, stats in report.items():
+        stats['state'] = breakers[name].state if name in breakers else 'closed'
+    return report
+
+
+def print_report():
+    """Print attempts and time spent per dependency."""
+    report = get_report()
+    if not report:
+        return
+    print("🔁 Network calls:")
+    for name, s in sorted(report.items()):
+        print(
+            f"   {name}: {s['calls']} call(s), {s['attempts']} attempt(s), "
+            f"{s['retries']} retr{'y' if s['retries'] == 1 else 'ies'}, {s['failures']} failed, "
+            f"{s['short_circuited']} short-circuited, {s['seconds']:.1f}s [{s['state']}]"
+        )
@@ -5,6 +5,10 @@ This script orchestrates all automated tasks:
 1. Daily: Generate AI research and save to Google Drive
 2. Weekly (Sunday): Generate weekly summary with all formats
 
+Tasks run as a small DAG of steps (see run_pipeline): each step starts as
+soon as the steps it depends on are done, independent steps run at the
+same time (PIPELINE_WORKERS / --jobs), and every step is timed.
+
 Setup:
 1. Install dependencies: pip install -r requirements.txt
 2. Set up Google Drive credentials (see google_drive_config.py)
@@ -24,30 +28,132 @@ Scheduling (cron examples):
 
 import argparse
 import datetime
+import os
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
 
+# Max pipeline steps running at the same time
+PIPELINE_WORKERS = int(os.environ.get("PIPELINE_WORKERS", "4"))
 
-def run_daily_research():
-    """Generate daily AI research and save to Drive."""
-    print("\n" + "="*60)
-    print("🌅 RUNNING DAILY AI RESEARCH PIPELINE")
-    print("="*60 + "\n")
+
+class Step:
+    """
+    One pipeline step.
+    
+    Args:
+        name: Step name
+        fn: Callable returning a truthy value on success
+        needs: Steps that must succeed first (else this step is skipped)
+        after: Steps that must finish first, whatever their outcome
+        critical: Whether a failure makes the whole run fail
+    """
+    
+    __slots__ = ('name', 'fn', 'needs', 'after', 'critical')
     
-    # Step 1: Generate new blog post
-    print("Step 1: Generating new AI research post...")
+    def __init__(self, name, fn, needs=(), after=(), critical=True):
+        self.name = name
+        self.fn = fn
+        self.needs = tuple(needs)
+        self.after = tuple(after)
+        self.critical = critical
+
+
+def _run_step(step):
+    start = time.monotonic()
     try:
-        import daily_researcher
-        daily_researcher.main()
-        print("✅ New research post generated\n")
+        ok = bool(step.fn())
     except Exception as e:
-        print(f"❌ Failed to generate research: {e}\n")
-        return False
+        print(f"❌ {step.name} failed: {e}\n")
+        ok = False
+    return ok, time.monotonic() - start
+
+
+def run_pipeline(steps, max_workers=PIPELINE_WORKERS):
+    """
+    Run steps as a DAG: each step starts as soon as its dependencies are
+    done, and independent steps run concurrently.
+    
+    Returns:
+        bool: True if every critical step succeeded
+    """
+    names = {step.name for step in steps}
+    for step in steps:
+        unknown = set(step.needs + step.after) - names
+        if unknown:
+            raise ValueError(f"Step {step.name} depends on unknown step(s): {', '.join(sorted(unknown))}")
+    
+    status = {}
+    timings = {}
+    pending = list(steps)
+    running = {}
+    start = time.monotonic()
     
-    # Step 2: Generate infographic and audio for new posts
-    print("Step 2: Generating blog visuals (infographic + audio)...")
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        while pending or running:
+            # Start (or skip) every step whose dependencies are settled
+            progressed = True
+            while progressed:
+                progressed = False
+                for step in list(pending):
+                    if any(dep not in status for dep in step.needs + step.after):
+                        continue
+                    pending.remove(step)
+                    progressed = True
+                    failed = [dep for dep in step.needs if status[dep] != 'ok']
+                    if failed:
+                        status[step.name] = 'skipped'
+                        print(f"⏭️ Skipping {step.name} ({', '.join(failed)} did not succeed)\n")
+                    else:
+                        running[pool.submit(_run_step, step)] = step
+            
+            if not running:
+                if pending:
+                    raise ValueError(f"Dependency cycle between: {', '.join(s.name for s in pending)}")
+                break
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                ok, seconds = future.result()
+                status[step.name] = 'ok' if ok else 'failed'
+                timings[step.name] = seconds
+    
+    wall = time.monotonic() - start
+    print("⏱️ Pipeline steps:")
+    for step in steps:
+        seconds = timings.get(step.name)
+        took = f"{seconds:.1f}s" if seconds is not None else "-"
+        print(f"   {step.name:<12} {status[step.name]:<8} {took}")
+    print(f"   total {wall:.1f}s wall clock ({sum(timings.values()):.1f}s of step time)\n")
+    
+    return all(status[step.name] == 'ok' for step in steps if step.critical)
+
+
+def _print_header(text):
+    # Steps run concurrently: print each banner in one call
+    print("\n" + "="*60 + f"\n{text}\n" + "="*60 + "\n")
+
+
+def generate_research():
+    """Step: generate new blog post(s)."""
+    print("Generating new AI research post...")
+    import daily_researcher
+    new_posts = daily_researcher.main()
+    if not new_posts:
+        # Nothing new to render, upload or push - don't run the rest for nothing
+        print("❌ No new research post was generated; skipping dependent steps\n")
+        return False
+    print("✅ New research post generated\n")
+    return True
+
+
+def generate_visuals():
+    """Step: infographic and audio for new posts (non-critical)."""
+    print("Generating blog visuals (infographic + audio)...")
     try:
         from generate_blog_visuals import generate_blog_assets, generate_assets_manifest
         generated = generate_blog_assets(regenerate=False)  # Only generate for new posts
@@ -55,22 +161,23 @@ def run_daily_research():
         print(f"✅ Generated {generated['infographics']} infographics, {generated['audio']} audio files\n")
     except Exception as e:
         print(f"⚠️ Blog visuals generation failed (non-critical): {e}\n")
-    
-    # Step 3: Save to Google Drive
-    print("Step 3: Uploading to Google Drive...")
-    try:
-        from save_daily_to_drive import save_daily_report_to_drive
-        result = save_daily_report_to_drive()
-        if result:
-            print("✅ Daily report uploaded to Google Drive\n")
-        else:
-            print("⚠️ No posts found for today\n")
-    except Exception as e:
-        print(f"❌ Failed to upload to Drive: {e}\n")
-        return False
-    
-    # Step 4: Commit and Push changes to Live Site
-    print("Step 4: Updating Live Site (Git Push)...")
+    return True
+
+
+def upload_daily_report():
+    """Step: save today's report to Google Drive."""
+    print("Uploading to Google Drive...")
+    from save_daily_to_drive import save_daily_report_to_drive
+    if save_daily_report_to_drive():
+        print("✅ Daily report uploaded to Google Drive\n")
+    else:
+        print("⚠️ No posts found for today\n")
+    return True
+
+
+def push_site():
+    """Step: commit and push changes to the live site."""
+    print("Updating Live Site (Git Push)...")
     try:
         import subprocess
         # Git Add
@@ -81,29 +188,60 @@ def run_daily_research():
         # Git Push
         subprocess.run(["git", "push"], check=True)
         print("✅ Git Push successful. Live site updated.\n")
+        return True
     except Exception as e:
         print(f"❌ Git Push failed (or nothing to commit): {e}\n")
-    
+        return False
+
+
+def weekly_summary():
+    """Step: weekly summary with all formats."""
+    _print_header("📊 RUNNING WEEKLY SUMMARY PIPELINE")
+    from weekly_summary_generator import generate_weekly_summary_and_upload
+    generate_weekly_summary_and_upload()
+    print("✅ Weekly summary complete\n")
     return True
 
 
-def run_weekly_summary():
-    """Generate weekly summary with all formats."""
-    print("\n" + "="*60)
-    print("📊 RUNNING WEEKLY SUMMARY PIPELINE")
-    print("="*60 + "\n")
+def daily_steps():
+    """
+    Daily pipeline:
     
-    try:
-        from weekly_summary_generator import generate_weekly_summary_and_upload
-        generate_weekly_summary_and_upload()
-        print("✅ Weekly summary complete\n")
-        return True
-    except Exception as e:
-        print(f"❌ Failed to generate weekly summary: {e}\n")
-        return False
+        generate -> visuals --\
+                 -> drive   ----> git_push
+    """
+    return [
+        Step('generate', generate_research),
+        Step('visuals', generate_visuals, needs=['generate'], critical=False),
+        Step('drive', upload_daily_report, needs=['generate']),
+        # A failed push used to be reported but not fail the run
+        Step('git_push', push_site, needs=['visuals', 'drive'], critical=False),
+    ]
+
+
+def weekly_steps(with_daily=False):
+    # The weekly summary should include today's post, but runs either way
+    return [Step('weekly', weekly_summary, after=['generate'] if with_daily else [])]
+
 
+def run_daily_research(max_workers=PIPELINE_WORKERS):
+    """Generate daily AI research and save to Drive."""
+    _print_header("🌅 RUNNING DAILY AI RESEARCH PIPELINE")
+    return run_pipeline(daily_steps(), max_workers)
+
+
+def run_weekly_summary(max_workers=PIPELINE_WORKERS):
+    """Generate weekly summary with all formats."""
+    return run_pipeline(weekly_steps(), max_workers)
 
-def run_smart():
+
+def run_daily_and_weekly(max_workers=PIPELINE_WORKERS):
+    """Daily pipeline plus weekly summary, overlapping once the post is generated."""
+    _print_header("🌅 RUNNING DAILY AI RESEARCH + WEEKLY SUMMARY PIPELINES")
+    return run_pipeline(daily_steps() + weekly_steps(with_daily=True), max_workers)
+
+
+def run_smart(max_workers=PIPELINE_WORKERS):
     """
     Smart mode: Run daily always, run weekly on Sundays.
     """
@@ -112,18 +250,13 @@ def run_smart():
     
     print(f"\n🗓️ Today is {today.strftime('%A, %B %d, %Y')}")
     
-    # Always run daily
-    daily_success = run_daily_research()
-    
-    # Run weekly on Sundays
+    # Run weekly on Sundays, alongside the daily steps
     if is_sunday:
-        print("\n📅 It's Sunday! Generating weekly summary...")
-        weekly_success = run_weekly_summary()
-    else:
-        print("\n📅 Weekly summary runs on Sundays only.")
-        weekly_success = True
+        print("\n📅 It's Sunday! Generating weekly summary too...")
+        return run_daily_and_weekly(max_workers)
     
-    return daily_success and weekly_success
+    print("\n📅 Weekly summary runs on Sundays only.")
+    return run_daily_research(max_workers)
 
 
 def main():
@@ -147,6 +280,8 @@ Examples:
                         help='Run both daily and weekly')
     parser.add_argument('--smart', action='store_true',
                         help='Smart mode: daily always, weekly on Sundays')
+    parser.add_argument('--jobs', type=int, default=PIPELINE_WORKERS,
+                        help=f'Pipeline steps run concurrently (default: {PIPELINE_WORKERS}, 1 = one at a time)')
     
     args = parser.parse_args()
     
@@ -162,14 +297,22 @@ Examples:
     success = True
     
     if args.smart:
-        success = run_smart()
-    elif args.all:
-        success = run_daily_research() and run_weekly_summary()
+        success = run_smart(args.jobs)
+    elif args.all or (args.daily and args.weekly):
+        success = run_daily_and_weekly(args.jobs)
+    elif args.daily:
+        success = run_daily_research(args.jobs)
     else:
-        if args.daily:
-            success = run_daily_research() and success
-        if args.weekly:
-            success = run_weekly_summary() and success
+        success = run_weekly_summary(args.jobs)
+    
+    try:
+        import gemini_client
+        gemini_client.print_stats()
+    except ImportError:
+        pass
+    
+    import resilience
+    resilience.print_report()
     
     print("\n" + "="*60)
     if success:
@@ -3,7 +3,6 @@ Save Daily AI Research Reports to Google Drive
 """
 
 import os
-import re
 import datetime
 from pathlib import Path
 import sys
@@ -14,40 +13,24 @@ from google_drive_config import (
     setup_vitainspire_folders,
     upload_content_to_drive
 )
+from blog_store import DATE_FORMAT, get_posts_on, parse_blog_posts
 
 SCRIPT_DIR = Path(__file__).parent
-BLOG_FILE_PATH = SCRIPT_DIR.parent / "js" / "blog-posts.js"
 
 
-def parse_blog_posts():
-    """Parse blog posts from blog-posts.js file."""
-    with open(BLOG_FILE_PATH, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    posts = []
-    post_pattern = re.compile(
-        r'\{\s*id:\s*"([^"]+)",\s*title:\s*"([^"]+)",\s*'
-        r'date:\s*"([^"]+)",\s*category:\s*"([^"]+)",\s*'
-        r'author:\s*"([^"]+)",\s*excerpt:\s*"([^"]+)",\s*'
-        r'content:\s*`([^`]+)`',
-        re.DOTALL
-    )
-    
-    for match in post_pattern.finditer(content):
-        posts.append({
-            'id': match.group(1), 'title': match.group(2),
-            'date': match.group(3), 'category': match.group(4),
-            'author': match.group(5), 'excerpt': match.group(6),
-            'content': match.group(7).strip()
-        })
-    return posts
+def get_todays_posts():
+    """Get posts from today (indexed date lookup)."""
+    return get_posts_on(datetime.date.today())
 
 
-def get_todays_posts(posts):
-    """Filter posts from today."""
-    today = datetime.datetime.now()
-    today_str = today.strftime("%B %d, %Y").replace(" 0", " ")
-    return [p for p in posts if p['date'] == today_str or p['date'] == today.strftime("%B %d, %Y")]
+def get_posts_for_date(date_str):
+    """Get posts for a date string such as "January 05, 2026"."""
+    try:
+        date = datetime.datetime.strptime(date_str, DATE_FORMAT).date()
+    except ValueError:
+        # Unusual format: fall back to an exact string match
+        return [p for p in parse_blog_posts() if p['date'] == date_str]
+    return get_posts_on(date)
 
 
 def create_daily_report_html(posts, date_str):
@@ -82,11 +65,10 @@ def save_daily_report_to_drive(date_str=None):
     service = get_google_drive_service()
     folders = setup_vitainspire_folders(service)
     
-    all_posts = parse_blog_posts()
     if date_str:
-        posts = [p for p in all_posts if p['date'] == date_str]
+        posts = get_posts_for_date(date_str)
     else:
-        posts = get_todays_posts(all_posts)
+        posts = get_todays_posts()
         date_str = datetime.datetime.now().strftime("%B %d, %Y")
     
     if not posts:
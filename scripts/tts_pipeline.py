@@ -0,0 +1,392 @@
+"""
+Text-to-Speech Pipeline
+
+Shared audio synthesis for the daily blog audio and the weekly summary.
+
+    synthesize([intro, body, outro], "post.mp3")
+
+splits each part on sentence boundaries into segments of at most
+SEGMENT_CHARS characters, synthesizes the segments concurrently and joins
+them, in order, into one MP3. Parts are segmented separately, so a fixed
+intro or outro always produces the same segment.
+
+Every segment is cached on disk (scripts/.cache/tts), keyed by backend,
+text and voice settings, so unchanged text is never synthesized twice.
+
+Backends:
+    gtts     Google Translate TTS (network). Output is a plain stream of
+             MP3 frames (gTTS joins its own requests the same way), so
+             segments are joined by concatenation.
+    espeak   Local espeak-ng / espeak subprocess.
+    piper    Local piper subprocess (needs PIPER_MODEL).
+
+The local engines produce WAV; segments are joined with the wave module
+and encoded to MP3 with ffmpeg. TTS_BACKEND may list several backends,
+e.g. "gtts,espeak": the first available one is used, and if it fails for
+a script the next one is tried.
+
+With encode=True the joined audio is re-encoded for speech by ffmpeg in
+a single pass: mono, AUDIO_SAMPLE_RATE, AUDIO_BITRATE CBR MP3 and EBU R128
+loudness normalization (loudnorm), so every clip plays at the same level.
+
+Environment variables:
+    AUDIO_BITRATE       MP3 bitrate for encoded speech (default 48k)
+    AUDIO_SAMPLE_RATE   Sample rate for encoded speech (default 24000)
+    AUDIO_LOUDNESS      Integrated loudness target in LUFS (default -16)
+    TTS_BACKEND         Backend name(s), comma separated (default gtts)
+    TTS_SEGMENT_CHARS   Max characters per segment (default 400)
+    TTS_MAX_WORKERS     Concurrent segment requests (default 4)
+    TTS_CACHE_MAX_MB    Size limit for the segment cache (default 200)
+    ESPEAK_VOICE        espeak voice (default en-us)
+    ESPEAK_SPEED        espeak words per minute (default 165)
+    PIPER_MODEL         Path to the piper .onnx voice model
+"""
+
+import base64
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_file import atomic_write_bytes
+from disk_cache import DiskCache, make_key
+from resilience import call_with_retry
+
+LANG = 'en'
+BACKENDS_ENV = os.environ.get("TTS_BACKEND", "gtts")
+SEGMENT_CHARS = int(os.environ.get("TTS_SEGMENT_CHARS", "400"))
+MAX_WORKERS = int(os.environ.get("TTS_MAX_WORKERS", "4"))
+ESPEAK_VOICE = os.environ.get("ESPEAK_VOICE", "en-us")
+ESPEAK_SPEED = os.environ.get("ESPEAK_SPEED", "165")
+PIPER_MODEL = os.environ.get("PIPER_MODEL")
+SUBPROCESS_TIMEOUT = 120
+AUDIO_BITRATE = os.environ.get("AUDIO_BITRATE", "48k")
+AUDIO_SAMPLE_RATE = os.environ.get("AUDIO_SAMPLE_RATE", "24000")
+AUDIO_LOUDNESS = os.environ.get("AUDIO_LOUDNESS", "-16")
+CACHE_MAX_BYTES = int(float(os.environ.get("TTS_CACHE_MAX_MB", "200")) * 1024 * 1024)
+
+segment_cache = DiskCache("tts", max_bytes=CACHE_MAX_BYTES)
+
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+CLAUSE_END = re.compile(r'(?<=[,;:])\s+')
+
+
+def _pack(pieces, max_chars):
+    """Greedily join pieces with spaces into chunks of at most max_chars."""
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def split_segments(text, max_chars=SEGMENT_CHARS):
+    """
+    Split text into speakable segments on sentence boundaries.
+
+    Sentences longer than max_chars are split on clause punctuation, then
+    on words.
+
+    Returns:
+        list: Segment strings, in reading order
+    """
+    text = re.sub(r'\s+', ' ', text or '').strip()
+    if not text:
+        return []
+
+    pieces = []
+    for sentence in SENTENCE_END.split(text):
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+            continue
+        for clause in CLAUSE_END.split(sentence):
+            if len(clause) <= max_chars:
+                pieces.append(clause)
+            else:
+                pieces.extend(_pack(clause.split(' '), max_chars))
+    return _pack(pieces, max_chars)
+
+
+class GTTSBackend:
+    """Google Translate TTS via gTTS. Returns MP3 segments."""
+
+    name = 'gtts'
+    audio_format = 'mp3'
+
+    def available(self):
+        try:
+            import gtts  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def cache_id(self, lang, slow):
+        return ('gtts', lang, slow)
+
+    def synthesize(self, text, lang, slow):
+        from gtts import gTTS
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=lang, slow=slow).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class EspeakBackend:
+    """Local espeak-ng (or espeak) subprocess. Returns WAV segments."""
+
+    name = 'espeak'
+    audio_format = 'wav'
+
+    def _binary(self):
+        return shutil.which('espeak-ng') or shutil.which('espeak')
+
+    def available(self):
+        return self._binary() is not None
+
+    def cache_id(self, lang, slow):
+        speed = int(ESPEAK_SPEED) * (3 if slow else 4) // 4
+        return ('espeak', ESPEAK_VOICE, speed)
+
+    def synthesize(self, text, lang, slow):
+        speed = str(self.cache_id(lang, slow)[2])
+        result = subprocess.run(
+            [self._binary(), '--stdout', '-v', ESPEAK_VOICE, '-s', speed],
+            input=text.encode('utf-8'), capture_output=True, check=True, timeout=SUBPROCESS_TIMEOUT
+        )
+        return result.stdout
+
+
+class PiperBackend:
+    """Local piper subprocess with the PIPER_MODEL voice. Returns WAV segments."""
+
+    name = 'piper'
+    audio_format = 'wav'
+
+    def available(self):
+        return shutil.which('piper') is not None and bool(PIPER_MODEL) and Path(PIPER_MODEL).exists()
+
+    def cache_id(self, lang, slow):
+        return ('piper', Path(PIPER_MODEL).name, slow)
+
+    def synthesize(self, text, lang, slow):
+        fd, wav_path = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
+        try:
+            command = ['piper', '--model', PIPER_MODEL, '--output_file', wav_path]
+            if slow:
+                command += ['--length_scale', '1.3']
+            subprocess.run(command, input=text.encode('utf-8'), capture_output=True,
+                           check=True, timeout=SUBPROCESS_TIMEOUT)
+            return Path(wav_path).read_bytes()
+        finally:
+            os.unlink(wav_path)
+
+
+BACKENDS = {backend.name: backend for backend in (GTTSBackend(), EspeakBackend(), PiperBackend())}
+
+
+def set_backend(names):
+    """Override TTS_BACKEND for this process (e.g. "espeak" or "gtts,espeak")."""
+    global BACKENDS_ENV
+    get_backends(names)
+    BACKENDS_ENV = names
+
+
+def get_backends(names=None):
+    """
+    Resolve backend names (default: TTS_BACKEND) to available backends.
+
+    Raises:
+        ImportError: None of the requested backends is available
+    """
+    names = names or BACKENDS_ENV
+    if isinstance(names, str):
+        names = [n.strip() for n in names.split(',') if n.strip()]
+    unknown = [n for n in names if n not in BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown TTS backend(s): {', '.join(unknown)} (choose from {', '.join(BACKENDS)})")
+    backends = [BACKENDS[n] for n in names if BACKENDS[n].available()]
+    if not backends:
+        raise ImportError(f"No TTS backend available (tried: {', '.join(names)})")
+    return backends
+
+
+def join_wav(segments):
+    """Join WAV segments (same sample format) into one WAV file."""
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as out:
+        for i, data in enumerate(segments):
+            with wave.open(io.BytesIO(data), 'rb') as segment:
+                if i == 0:
+                    out.setparams(segment.getparams())
+                out.writeframes(segment.readframes(segment.getnframes()))
+    return output.getvalue()
+
+
+def _ffmpeg(input_format, audio, *options):
+    if shutil.which('ffmpeg') is None:
+        raise RuntimeError("ffmpeg is not installed")
+    result = subprocess.run(
+        ['ffmpeg', '-hide_banner', '-loglevel', 'error', '-f', input_format, '-i', 'pipe:0',
+         *options, '-codec:a', 'libmp3lame', '-f', 'mp3', 'pipe:1'],
+        input=audio, capture_output=True, check=True, timeout=SUBPROCESS_TIMEOUT
+    )
+    return result.stdout
+
+
+def wav_to_mp3(wav_bytes):
+    """Encode WAV audio to MP3 with ffmpeg."""
+    return _ffmpeg('wav', wav_bytes, '-q:a', '4')
+
+
+def encode_speech(audio, input_format='mp3'):
+    """
+    Re-encode audio for speech: mono, low bitrate CBR MP3, loudness normalized.
+
+    Args:
+        audio: Input audio bytes
+        input_format: 'mp3' or 'wav'
+
+    Returns:
+        bytes: Encoded MP3
+
+    Raises:
+        RuntimeError: ffmpeg is not installed
+    """
+    return _ffmpeg(
+        input_format, audio,
+        '-ac', '1', '-ar', AUDIO_SAMPLE_RATE,
+        '-af', f'loudnorm=I={AUDIO_LOUDNESS}:TP=-1.5:LRA=11',
+        '-b:a', AUDIO_BITRATE,
+    )
+
+
+def probe_audio(path):
+    """
+    Duration, channels and bitrate of an audio file, via ffprobe.
+
+    Returns:
+        dict ('duration' seconds, 'channels', 'bit_rate' bits/s) or None if
+        ffprobe is missing or can't read the file
+    """
+    if shutil.which('ffprobe') is None:
+        return None
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', 'a:0',
+             '-show_entries', 'format=duration,bit_rate:stream=channels', '-of', 'json', str(path)],
+            capture_output=True, check=True, timeout=30, text=True
+        )
+        info = json.loads(result.stdout)
+        return {
+            'duration': round(float(info['format']['duration']), 1),
+            'channels': int(info['streams'][0]['channels']),
+            'bit_rate': int(info['format'].get('bit_rate', 0)),
+        }
+    except (subprocess.SubprocessError, ValueError, KeyError, IndexError):
+        return None
+
+
+def bitrate_bps(bitrate=None):
+    """'48k' -> 48000"""
+    bitrate = (bitrate or AUDIO_BITRATE).lower()
+    return int(float(bitrate[:-1]) * 1000) if bitrate.endswith('k') else int(bitrate)
+
+
+def synthesize_segment(text, backend, lang=LANG, slow=False):
+    """
+    Synthesize one segment, serving repeated text from the cache.
+
+    Returns:
+        tuple: (audio bytes in backend.audio_format, True if served from cache)
+    """
+    key = make_key(*backend.cache_id(lang, slow), text)
+    cached = segment_cache.get(key)
+    if cached is not None:
+        return base64.b64decode(cached), True
+
+    if backend.audio_format == 'mp3':
+        audio = call_with_retry(backend.synthesize, text, lang, slow, name=f"tts-{backend.name}")
+    else:
+        # Local engines don't have transient failures worth retrying
+        audio = backend.synthesize(text, lang, slow)
+    segment_cache.set(key, base64.b64encode(audio).decode('ascii'))
+    return audio, False
+
+
+def _synthesize_with(backend, segments, lang, slow, max_workers, encode):
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(segments)))) as executor:
+        results = list(executor.map(lambda s: synthesize_segment(s, backend, lang, slow), segments))
+
+    chunks = [data for data, _ in results]
+    if backend.audio_format == 'wav':
+        joined = join_wav(chunks)
+        audio = encode_speech(joined, 'wav') if encode else wav_to_mp3(joined)
+    else:
+        audio = b"".join(chunks)
+        if encode:
+            try:
+                audio = encode_speech(audio, 'mp3')
+            except RuntimeError as e:
+                print(f"⚠️ Keeping unencoded audio: {e}")
+    cached = sum(1 for _, hit in results if hit)
+    print(f"🔊 TTS ({backend.name}): {len(segments)} segment(s), {cached} cached, "
+          f"{len(audio) / 1024:.0f} KB in {time.monotonic() - start:.1f}s")
+    return audio
+
+
+def synthesize(parts, filename=None, lang=LANG, slow=False, max_workers=MAX_WORKERS, backend=None,
+               encode=False):
+    """
+    Synthesize a script into a single MP3.
+
+    Args:
+        parts: Script text, or a list of parts segmented separately
+            (e.g. [intro, body, outro])
+        filename: Optional path to write the MP3 to
+        lang / slow: Voice settings (lang is used by gTTS only)
+        max_workers: Concurrent segment requests
+        backend: Backend name(s), defaults to TTS_BACKEND
+        encode: Re-encode with encode_speech() (mono, AUDIO_BITRATE, loudnorm)
+
+    Returns:
+        bytes: The joined MP3
+
+    Raises:
+        ImportError: No requested backend is available
+        ValueError: The script is empty
+    """
+    if isinstance(parts, str):
+        parts = [parts]
+    segments = [segment for part in parts for segment in split_segments(part)]
+    if not segments:
+        raise ValueError("Nothing to synthesize: empty script")
+
+    backends = get_backends(backend)
+    for i, tts in enumerate(backends):
+        try:
+            audio = _synthesize_with(tts, segments, lang, slow, max_workers, encode)
+            break
+        except Exception as e:
+            if i == len(backends) - 1:
+                raise
+            print(f"⚠️ TTS backend {tts.name} failed ({e}), falling back to {backends[i + 1].name}")
+
+    if filename:
+        atomic_write_bytes(filename, audio)
+    return audio
@@ -3,74 +3,51 @@ Weekly Summary Generator for VitaInspire AI Research
 
 Generates a weekly summary from daily reports every Sunday with:
 - HTML summary report
-- Read aloud audio version (using gTTS)
+- Read aloud audio version (gTTS or a local TTS engine)
 - Slide deck (PowerPoint)
 - Infographic (PNG image)
 
-All outputs are saved to Google Drive.
+All outputs are saved to Google Drive. The artifacts are built in parallel
+workers, and each one is handed to a bounded pool of uploaders as soon as
+it is ready, so the run takes about as long as the slowest artifact.
+
+Environment variables:
+    WEEKLY_BUILD_WORKERS    Artifacts built concurrently (default 4)
+    WEEKLY_UPLOAD_WORKERS   Concurrent Drive uploads (default 3)
 """
 
+import io
 import os
-import re
 import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
-try:
-    import google.generativeai as genai
-except ImportError:
+import gemini_client
+if gemini_client.genai is None:
     print("Please install: pip install google-generativeai")
     
 from google_drive_config import (
+    MIME_TYPES,
     get_google_drive_service,
+    get_thread_service,
     setup_vitainspire_folders,
-    upload_content_to_drive,
-    upload_file_to_drive
+    upload_content_to_drive
 )
+from blog_store import get_posts_between
 
 SCRIPT_DIR = Path(__file__).parent
-BLOG_FILE_PATH = SCRIPT_DIR.parent / "js" / "blog-posts.js"
-TEMP_DIR = SCRIPT_DIR / "temp_weekly"
 API_KEY = os.environ.get("GEMINI_API_KEY")
+BUILD_WORKERS = int(os.environ.get("WEEKLY_BUILD_WORKERS", "4"))
+UPLOAD_WORKERS = int(os.environ.get("WEEKLY_UPLOAD_WORKERS", "3"))
 
 
-def parse_blog_posts():
-    """Parse blog posts from blog-posts.js."""
-    with open(BLOG_FILE_PATH, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    posts = []
-    pattern = re.compile(
-        r'\{\s*id:\s*"([^"]+)",\s*title:\s*"([^"]+)",\s*'
-        r'date:\s*"([^"]+)",\s*category:\s*"([^"]+)",\s*'
-        r'author:\s*"([^"]+)",\s*excerpt:\s*"([^"]+)",\s*'
-        r'content:\s*`([^`]+)`', re.DOTALL
-    )
-    
-    for m in pattern.finditer(content):
-        posts.append({
-            'id': m.group(1), 'title': m.group(2), 'date': m.group(3),
-            'category': m.group(4), 'author': m.group(5),
-            'excerpt': m.group(6), 'content': m.group(7).strip()
-        })
-    return posts
-
-
-def get_week_posts(posts):
-    """Get posts from the past 7 days."""
-    today = datetime.datetime.now()
-    week_ago = today - datetime.timedelta(days=7)
-    
-    week_posts = []
-    for post in posts:
-        try:
-            post_date = datetime.datetime.strptime(post['date'], "%B %d, %Y")
-            if week_ago <= post_date <= today:
-                week_posts.append(post)
-        except ValueError:
-            continue
-    return week_posts
+def get_week_posts(today=None):
+    """Get posts from the past 7 days (today and the 6 days before)."""
+    today = today or datetime.date.today()
+    return get_posts_between(today - datetime.timedelta(days=6), today)
 
 
 def generate_weekly_summary(posts):
@@ -79,9 +56,6 @@ def generate_weekly_summary(posts):
         print("Warning: GEMINI_API_KEY not set, using simple summary")
         return create_simple_summary(posts)
     
-    genai.configure(api_key=API_KEY)
-    model = genai.GenerativeModel('gemini-2.5-flash')
-    
     # Prepare post summaries
     post_summaries = "\n\n".join([
         f"Title: {p['title']}\nCategory: {p['category']}\nExcerpt: {p['excerpt']}"
@@ -105,11 +79,11 @@ Generate a JSON response with these fields:
 - slide_bullets: Array of 5-6 key points for a presentation"""
 
     try:
-        response = model.generate_content(prompt, generation_config={
-            "response_mime_type": "application/json"
-        })
         import json
-        return json.loads(response.text)
+        response_text = gemini_client.generate_text(prompt, generation_config={
+            "response_mime_type": "application/json"
+        }, validate=json.loads)
+        return json.loads(response_text)
     except Exception as e:
         print(f"AI summary generation failed: {e}")
         return create_simple_summary(posts)
@@ -258,17 +232,29 @@ h1{{font-size:2.5rem;margin-bottom:10px;}}
 </div></body></html>'''
 
 
+def _describe(output):
+    return output if isinstance(output, (str, Path)) else "in memory"
+
+
 def create_audio_file(summary, filename):
-    """Generate audio file using gTTS."""
+    """
+    Generate audio file with the configured TTS backend (see tts_pipeline).
+    
+    filename may also be a binary file object (e.g. io.BytesIO), as for
+    the other artifact builders.
+    """
     try:
-        from gtts import gTTS
+        import tts_pipeline
         script = summary.get("audio_script", summary.get("executive_summary", ""))
-        tts = gTTS(text=script, lang='en', slow=False)
-        tts.save(filename)
-        print(f"✅ Audio file created: {filename}")
+        audio = tts_pipeline.synthesize(script, encode=True)
+        if isinstance(filename, (str, Path)):
+            Path(filename).write_bytes(audio)
+        else:
+            filename.write(audio)
+        print(f"✅ Audio file created: {_describe(filename)}")
         return True
-    except ImportError:
-        print("gTTS not installed. Run: pip install gtts")
+    except ImportError as e:
+        print(f"{e}. Run: pip install gtts (or set TTS_BACKEND=espeak for offline audio)")
         return False
     except Exception as e:
         print(f"Audio generation failed: {e}")
@@ -382,7 +368,7 @@ def create_slide_deck(summary, filename):
         closing.text_frame.paragraphs[0].font.bold = True
         
         prs.save(filename)
-        print(f"✅ Slide deck created: {filename}")
+        print(f"✅ Slide deck created: {_describe(filename)}")
         return True
     except Exception as e:
         print(f"Slide deck generation failed: {e}")
@@ -494,8 +480,8 @@ def create_infographic(summary, filename):
         draw.text((50, y+20), "VitaInspire", fill='#667eea', font=font_heading)
         draw.text((250, y+25), "Building AI Careers  •  Transforming Social Impact", fill='#888888', font=font_body)
         
-        img.save(filename)
-        print(f"✅ Infographic created: {filename}")
+        img.save(filename, format='PNG')
+        print(f"✅ Infographic created: {_describe(filename)}")
         return True
     except ImportError:
         print("Pillow not installed. Run: pip install Pillow")
@@ -507,9 +493,77 @@ def create_infographic(summary, filename):
         return False
 
 
-def generate_weekly_summary_and_upload():
-    """Main function to generate all weekly summary formats and upload."""
-    today = datetime.datetime.now()
+def _upload(upload, built):
+    # Each upload thread uses its own Drive service
+    return upload(get_thread_service(), built)
+
+
+def build_and_upload(artifacts, build_workers=BUILD_WORKERS, upload_workers=UPLOAD_WORKERS):
+    """
+    Build artifacts in parallel and upload each one as soon as it is built.
+    
+    Args:
+        artifacts: List of (label, build, upload). build() returns the built
+            artifact (falsy on failure); upload(service, built) uploads it.
+        build_workers: Artifacts built concurrently
+        upload_workers: Concurrent uploads
+    
+    Returns:
+        dict: {label: True if built and uploaded}
+    """
+    results = {}
+    start = time.monotonic()
+    
+    with ThreadPoolExecutor(max_workers=build_workers) as builders, \
+            ThreadPoolExecutor(max_workers=upload_workers) as uploaders:
+        builds = {builders.submit(build): (label, upload) for label, build, upload in artifacts}
+        uploads = {}
+        
+        for future in as_completed(builds):
+            label, upload = builds[future]
+            try:
+                built = future.result()
+            except Exception as e:
+                print(f"❌ {label}: build failed: {e}")
+                built = None
+            if not built:
+                results[label] = False
+                continue
+            print(f"🔨 {label} built ({time.monotonic() - start:.1f}s), uploading...")
+            uploads[uploaders.submit(_upload, upload, built)] = label
+        
+        for future in as_completed(uploads):
+            label = uploads[future]
+            try:
+                future.result()
+                results[label] = True
+                print(f"☁️ {label} uploaded ({time.monotonic() - start:.1f}s)")
+            except Exception as e:
+                print(f"❌ {label}: upload failed: {e}")
+                results[label] = False
+    
+    return results
+
+
+def render_to_bytes(create, summary):
+    """Run an artifact builder into an in-memory buffer; returns the bytes or None."""
+    buffer = io.BytesIO()
+    if not create(summary, buffer):
+        return None
+    return buffer.getvalue()
+
+
+def generate_weekly_summary_and_upload(today=None):
+    """
+    Main function to generate all weekly summary formats and upload.
+    
+    Artifacts are rendered in memory and streamed to Drive, so nothing is
+    written locally and runs for different weeks can go on side by side.
+    
+    Args:
+        today: Last day of the week to summarize (default: now)
+    """
+    today = today or datetime.datetime.now()
     
     # Check if today is Sunday
     if today.weekday() != 6:
@@ -522,8 +576,7 @@ def generate_weekly_summary_and_upload():
     print(f"\n📅 Generating weekly summary for {week_start} to {week_end}\n")
     
     # Get week's posts
-    all_posts = parse_blog_posts()
-    week_posts = get_week_posts(all_posts)
+    week_posts = get_week_posts(today.date())
     
     if not week_posts:
         print("No posts found for this week!")
@@ -531,56 +584,65 @@ def generate_weekly_summary_and_upload():
     
     print(f"Found {len(week_posts)} posts for this week")
     
-    # Generate summary
-    print("\n🤖 Generating AI-powered summary...")
-    summary = generate_weekly_summary(week_posts)
-    
-    # Create temp directory
-    TEMP_DIR.mkdir(exist_ok=True)
-    
-    # Connect to Drive
-    print("\n☁️ Connecting to Google Drive...")
-    service = get_google_drive_service()
-    folders = setup_vitainspire_folders(service)
+    with ThreadPoolExecutor(max_workers=1) as drive_setup:
+        # Connect to Drive while Gemini writes the summary
+        print("\n☁️ Connecting to Google Drive...")
+        folders_future = drive_setup.submit(
+            lambda: setup_vitainspire_folders(get_google_drive_service())
+        )
+        
+        # Generate summary
+        print("\n🤖 Generating AI-powered summary...")
+        summary = generate_weekly_summary(week_posts)
+        
+        folders = folders_future.result()
     
     date_suffix = today.strftime("%Y%m%d")
     
-    # 1. HTML Report
-    print("\n📄 Creating HTML report...")
-    html_content = create_weekly_html(summary, week_start, week_end)
-    upload_content_to_drive(
-        service, html_content,
-        f"Weekly_Summary_{date_suffix}.html",
-        folders['weekly_html'], 'text/html'
-    )
+    def artifact(label, create, extension, folder, mime_type):
+        name = f"Weekly_Summary_{date_suffix}.{extension}"
+        return (
+            label,
+            lambda: render_to_bytes(create, summary),
+            lambda service, data: upload_content_to_drive(service, data, name, folders[folder], mime_type),
+        )
     
-    # 2. Audio (Read Aloud)
-    print("\n🎧 Creating audio version...")
-    audio_file = TEMP_DIR / f"Weekly_Summary_{date_suffix}.mp3"
-    if create_audio_file(summary, str(audio_file)):
-        upload_file_to_drive(service, audio_file, folders['weekly_audio'])
-    
-    # 3. Slide Deck
-    print("\n📊 Creating slide deck...")
-    slides_file = TEMP_DIR / f"Weekly_Summary_{date_suffix}.pptx"
-    if create_slide_deck(summary, str(slides_file)):
-        upload_file_to_drive(service, slides_file, folders['weekly_slides'])
-    
-    # 4. Infographic
-    print("\n🎨 Creating infographic...")
-    infographic_file = TEMP_DIR / f"Weekly_Summary_{date_suffix}.png"
-    if create_infographic(summary, str(infographic_file)):
-        upload_file_to_drive(service, infographic_file, folders['weekly_infographics'])
-    
-    # Cleanup
-    import shutil
-    if TEMP_DIR.exists():
-        shutil.rmtree(TEMP_DIR)
+    print("\n📦 Building and uploading HTML report, audio, slide deck and infographic...")
+    results = build_and_upload([
+        # 1. HTML Report
+        ("HTML report",
+         lambda: create_weekly_html(summary, week_start, week_end),
+         lambda service, html: upload_content_to_drive(
+             service, html, f"Weekly_Summary_{date_suffix}.html", folders['weekly_html'], 'text/html'
+         )),
+        # 2. Audio (Read Aloud)
+        artifact("Audio", create_audio_file, "mp3", 'weekly_audio', MIME_TYPES['.mp3']),
+        # 3. Slide Deck
+        artifact("Slide deck", create_slide_deck, "pptx", 'weekly_slides', MIME_TYPES['.pptx']),
+        # 4. Infographic
+        artifact("Infographic", create_infographic, "png", 'weekly_infographics', MIME_TYPES['.png']),
+    ])
     
+    failed = [label for label, ok in results.items() if not ok]
     print("\n" + "="*50)
-    print("✅ Weekly summary generation complete!")
+    if failed:
+        print(f"⚠️ Weekly summary finished with failures: {', '.join(failed)}")
+    else:
+        print("✅ Weekly summary generation complete!")
     print("="*50)
 
 
 if __name__ == "__main__":
-    generate_weekly_summary_and_upload()
+    import argparse
+    parser = argparse.ArgumentParser(description="Generate and upload the weekly summary")
+    parser.add_argument('--no-llm-cache', action='store_true',
+                        help='Bypass the Gemini response cache')
+    parser.add_argument('--week-ending', type=datetime.date.fromisoformat,
+                        help='Last day of the week to summarize, YYYY-MM-DD (default: today)')
+    args = parser.parse_args()
+    if args.no_llm_cache:
+        gemini_client.set_cache_bypass(True)
+    week_ending = None
+    if args.week_ending:
+        week_ending = datetime.datetime.combine(args.week_ending, datetime.time())
+    generate_weekly_summary_and_upload(week_ending)